@@ -18,36 +18,108 @@ Usage examples:
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import sys
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
-import httpx
 import typer
-from rich.console import Console
 
-from .metadata_validator import AccessibilityChecker, ConsistencyChecker, MetadataValidator
-from .csv_validator import CsvValidator
-from .models import QualityReport
-from .reporter import render_markdown, render_terminal
+try:  # optional accelerator: pip install "open-data-quality[fast]"
+    import orjson
+except ImportError:
+    orjson = None
+
+# httpx, rich, DuckDB and the validators are imported where they are used, so that
+# `--help` and argument errors return without paying their import cost.
+if TYPE_CHECKING:
+    import httpx
+    from rich.console import Console
+
+    from .csv_validator import CsvValidator
+    from .models import QualityReport
+
+# 1 MiB reads keep the number of write() calls low on multi-hundred-MB resources
+_DOWNLOAD_CHUNK = 1 << 20
 
 app = typer.Typer(
     name="odq-ckan",
     help="Open data quality validator for CKAN portal datasets (phases 5–6 + optional CSV).",
     add_completion=False,
+    rich_markup_mode=None,  # plain Click help: no rich import for --help
 )
 
 
-def _fetch_ckan_metadata(portal_url: str, dataset_id: str, console: Console) -> dict:
-    """Call CKAN package_show API and return the result dict."""
+def _cache_path(url: str) -> Path:
+    """On-disk cache file for a package_show URL (honours $XDG_CACHE_HOME)."""
+    base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "open-data-quality" / "ckan" / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def _load_cached(path: Path) -> dict | None:
+    """Cached entry for ``path``, or None (a miss) if it is unreadable or not in the shape we store."""
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("data"), dict):
+        return None
+    for key in ("etag", "last_modified"):
+        if not isinstance(entry.get(key), (str, type(None))):
+            return None
+    return entry
+
+
+def _store_cached(path: Path, resp: httpx.Response, data: dict) -> None:
+    """Cache a package_show response when the server gave us a validator to revalidate it with."""
+    etag = resp.headers.get("etag")
+    last_modified = resp.headers.get("last-modified")
+    if not (etag or last_modified):
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"etag": etag, "last_modified": last_modified, "data": data}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass  # caching is best-effort
+
+
+def _fetch_ckan_metadata(client: httpx.Client, portal_url: str, dataset_id: str, console: Console,
+                         use_cache: bool = True) -> dict:
+    """Call CKAN package_show API and return the result dict.
+
+    With ``use_cache`` the response is kept on disk and revalidated with
+    If-None-Match / If-Modified-Since; a 304 reuses the cached payload.
+    """
+    import httpx
+
     base = portal_url.rstrip("/")
     url = f"{base}/api/3/action/package_show?id={dataset_id}"
     console.print(f"[dim]Fetching metadata:[/dim] {url}")
+    cache_file = _cache_path(url) if use_cache else None
+    cached = _load_cached(cache_file) if cache_file and cache_file.exists() else None
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
     try:
-        resp = httpx.get(url, timeout=30, follow_redirects=True)
-        resp.raise_for_status()
-        data = resp.json()
+        resp = client.get(url, timeout=30, headers=headers)
+        if cached and resp.status_code == 304:
+            console.print("[dim]Metadata unchanged — using cached copy[/dim]")
+            data = cached["data"]
+        else:
+            resp.raise_for_status()
+            data = orjson.loads(resp.content) if orjson is not None else resp.json()
+            if cache_file and data.get("success"):
+                _store_cached(cache_file, resp, data)
     except httpx.HTTPStatusError as e:
         console.print(f"[bold red]HTTP error fetching metadata:[/bold red] {e}")
         raise typer.Exit(code=3)
@@ -66,33 +138,49 @@ def _fetch_ckan_metadata(portal_url: str, dataset_id: str, console: Console) ->
 def _pick_csv_resource(metadata: dict) -> dict | None:
     """Return the first CSV resource, or None."""
     for res in metadata.get("resources") or []:
-        fmt = (res.get("format") or res.get("distribution_format") or "").upper()
-        mime = (res.get("mimetype") or "").lower()
-        url = res.get("url") or ""
-        if fmt == "CSV" or "csv" in mime or url.lower().endswith(".csv"):
+        # cheapest test first; each one short-circuits the rest
+        fmt = res.get("format") or res.get("distribution_format") or ""
+        if len(fmt) == 3 and fmt.upper() == "CSV":
+            return res
+        mime = res.get("mimetype")
+        if mime and "csv" in mime.lower():
+            return res
+        url = res.get("url")
+        if url and url[-4:].lower() == ".csv":
             return res
     return None
 
 
-def _download_csv(url: str, console: Console, timeout: float = 60.0) -> Path | None:
-    """Download a resource to a temp file. Returns path or None on failure."""
-    console.print(f"[dim]Downloading:[/dim] {url}")
+def _download_csv(client: httpx.Client, url: str, console: Console, sample_rows: int,
+                  timeout: float = 60.0) -> CsvValidator | None:
+    """Stream a resource into a CsvValidator (backed by a temp file). Returns it or None on failure."""
+    from .csv_validator import CsvValidator
+
     try:
-        with httpx.stream("GET", url, follow_redirects=True, timeout=timeout) as resp:
+        # Transient spinner on a terminal, nothing on a pipe: one line per download
+        with console.status(f"[dim]Downloading:[/dim] {url}"), \
+                client.stream("GET", url, timeout=timeout) as resp:
             resp.raise_for_status()
-            suffix = ".csv"
-            tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
-            for chunk in resp.iter_bytes(chunk_size=65536):
-                tmp.write(chunk)
-            tmp.close()
-            size_mb = Path(tmp.name).stat().st_size / 1_048_576
-            console.print(f"[dim]Downloaded:[/dim] {size_mb:.1f} MB -> {tmp.name}")
-            return Path(tmp.name)
+            # Content-Length is the on-disk size only when the body is not content-encoded
+            length = resp.headers.get("content-length", "")
+            size_hint = int(length) if length.isdigit() and "content-encoding" not in resp.headers else None
+            validator = CsvValidator.from_stream(resp.iter_bytes(chunk_size=_DOWNLOAD_CHUNK),
+                                                 sample_rows=sample_rows, size_hint=size_hint)
+        size_mb = validator.spooled_bytes / 1_048_576
+        console.print(f"[dim]Downloaded:[/dim] {url} ({size_mb:.1f} MB) -> {validator.path}")
+        return validator
     except Exception as e:
-        console.print(f"[bold yellow]Warning:[/bold yellow] Could not download resource: {e}")
+        console.print(f"[bold yellow]Warning:[/bold yellow] Could not download resource {url}: {e}")
         return None
 
 
+def _exit_code(report: QualityReport) -> int:
+    """2 = blockers, 1 = major issues, 0 = otherwise."""
+    if report.has_blockers:
+        return 2
+    return 1 if report.majors else 0
+
+
 @app.command()
 def main(
     portal_url: Annotated[str, typer.Argument(help="Base URL of the CKAN portal (e.g. https://dati.gov.it/opendata)")],
@@ -103,42 +191,58 @@ def main(
     output_json: Annotated[Optional[Path], typer.Option("--output-json")] = None,
     output_md: Annotated[Optional[Path], typer.Option("--output-md")] = None,
     sample_rows: Annotated[int, typer.Option("--sample-rows", help="Max rows for CSV content checks")] = 50_000,
+    concurrency: Annotated[int, typer.Option("--concurrency", help="Max parallel resource URL checks")] = 8,
+    cache: Annotated[bool, typer.Option("--cache/--no-cache", help="Cache package_show responses on disk (revalidated via ETag/Last-Modified)")] = True,
     quiet: Annotated[bool, typer.Option("--quiet", "-q")] = False,
 ) -> None:
-    console = Console()
+    from rich.console import Console
 
-    # ── 1. Fetch CKAN metadata ──────────────────────────────────────────
-    metadata = _fetch_ckan_metadata(portal_url, dataset_id, console)
-    source_label = f"{portal_url}/dataset/{dataset_id}"
+    from .metadata_validator import AccessibilityChecker, ConsistencyChecker, MetadataValidator, pooled_client
+    from .models import QualityReport
 
-    report = QualityReport(source=source_label)
-    report.metadata = metadata
+    console = Console()
 
-    # ── 2. Accessibility check (HTTP HEAD on each resource URL) ─────────
-    if check_urls:
-        if not quiet:
-            console.print("[dim]Checking resource URLs...[/dim]")
-        checker = AccessibilityChecker(metadata, report)
-        checker.run()
-    else:
-        console.print("[dim]URL checks skipped (--no-check-urls)[/dim]")
+    # One connection pool (and TLS session per host) for package_show, the resource
+    # URL checks and the CSV download. With the optional `h2` package the probes to a
+    # host are multiplexed over a single HTTP/2 connection.
+    with pooled_client(30, concurrency) as client:
+        # ── 1. Fetch CKAN metadata ──────────────────────────────────────
+        metadata = _fetch_ckan_metadata(client, portal_url, dataset_id, console, use_cache=cache)
+        source_label = f"{portal_url}/dataset/{dataset_id}"
 
-    # ── 3. Metadata / DCAT-AP compliance ────────────────────────────────
-    if not quiet:
-        console.print("[dim]Validating metadata...[/dim]")
-    MetadataValidator(metadata, portal_url=portal_url, report=report).run()
+        report = QualityReport(source=source_label)
+        report.metadata = metadata
 
-    # ── 4. Optional: download + full CSV validation ──────────────────────
-    csv_path: Path | None = None
-    if download:
-        csv_res = _pick_csv_resource(metadata)
+        # The CSV is fetched before the URL checks: a successful download already
+        # proves that resource is reachable, so it is not probed a second time.
+        csv_res = _pick_csv_resource(metadata) if download else None
+        validator = None
         if csv_res:
             csv_url = csv_res.get("url") or ""
-            csv_path = _download_csv(csv_url, console)
-            if csv_path:
+            validator = _download_csv(client, csv_url, console, sample_rows=sample_rows)
+
+        # ── 2. Accessibility check (HTTP HEAD on each resource URL) ─────
+        if check_urls:
+            if not quiet:
+                console.print("[dim]Checking resource URLs...[/dim]")
+            checker = AccessibilityChecker(metadata, report, client=client, concurrency=concurrency)
+            checker.run(skip_urls={csv_url.strip()} if validator else ())
+        else:
+            console.print("[dim]URL checks skipped (--no-check-urls)[/dim]")
+
+        # ── 3. Metadata / DCAT-AP compliance ────────────────────────────
+        if not quiet:
+            console.print("[dim]Validating metadata...[/dim]")
+        MetadataValidator(metadata, portal_url=portal_url, report=report).run()
+
+        # ── 4. Optional: full CSV validation of the downloaded file ──────
+        csv_path: Path | None = None
+        if download:
+            if validator:
+                csv_path = validator.path
                 if not quiet:
                     console.print("[dim]Running CSV validation...[/dim]")
-                csv_report = CsvValidator(csv_path, sample_rows=sample_rows).run()
+                csv_report = validator.run()
                 # Merge CSV findings into main report
                 report.findings.extend(csv_report.findings)
                 report.dimensions.extend(csv_report.dimensions)
@@ -149,35 +253,42 @@ def main(
                     csv_path.unlink()
                 except Exception:
                     pass
+            elif not csv_res:
+                console.print("[yellow]No CSV resource found — skipping file validation[/yellow]")
         else:
-            console.print("[yellow]No CSV resource found — skipping file validation[/yellow]")
-    else:
-        # Still add CSV score dimensions as N/A
-        from .models import ScoreDimension
-        for name, pts in [("File format compliance", 15), ("Data structure quality", 20), ("Data content quality", 25)]:
-            report.dimensions.append(ScoreDimension(name, pts, pts, notes=["Not checked — use --download"]))
+            # Still add CSV score dimensions as N/A
+            from .models import ScoreDimension
+            for name, pts in [("File format compliance", 15), ("Data structure quality", 20), ("Data content quality", 25)]:
+                report.dimensions.append(ScoreDimension(name, pts, pts, notes=["Not checked — use --download"]))
 
     # ── 5. Render report ─────────────────────────────────────────────────
-    if not quiet:
-        render_terminal(report, console=console, show_ok=show_ok)
+    if quiet and not (output_json or output_md):
+        raise typer.Exit(code=_exit_code(report))   # exit code only: nothing to render
 
-    if output_json:
-        output_json.write_text(report.to_json(), encoding="utf-8")
-        if not quiet:
-            console.print(f"[dim]JSON written to:[/dim] {output_json}")
+    from .reporter import render_markdown, render_terminal, write_report_file
 
+    # Serialise here (pure Python, GIL-bound); only the file writes go to the pool,
+    # where they overlap with the terminal render.
+    writes: list[tuple[Path, bytes, str]] = []
+    today = date.today().isoformat()   # same validation date in every rendering
+    if output_json:
+        writes.append((output_json, report.to_json_bytes(), "JSON written to:"))
     if output_md:
-        output_md.write_text(render_markdown(report, show_ok=show_ok), encoding="utf-8")
+        writes.append((output_md, render_markdown(report, show_ok=show_ok, today=today).encode("utf-8"),
+                       "Markdown written to:"))
+
+    with ThreadPoolExecutor(max_workers=max(1, len(writes))) as pool:
+        futures = [pool.submit(write_report_file, path, data) for path, data, _ in writes]
         if not quiet:
-            console.print(f"[dim]Markdown written to:[/dim] {output_md}")
+            render_terminal(report, console=console, show_ok=show_ok, today=today)
+        for fut in futures:
+            fut.result()
 
-    # Exit codes
-    if report.has_blockers:
-        raise typer.Exit(code=2)
-    elif report.majors:
-        raise typer.Exit(code=1)
-    else:
-        raise typer.Exit(code=0)
+    if not quiet:
+        for path, _, label in writes:
+            console.print(f"[dim]{label}[/dim] {path}")
+
+    raise typer.Exit(code=_exit_code(report))
 
 
 if __name__ == "__main__":
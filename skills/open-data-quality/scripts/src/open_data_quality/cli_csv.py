@@ -13,25 +13,44 @@ from __future__ import annotations
 
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
-from rich.console import Console
 
-from .csv_validator import CsvValidator
-from .reporter import render_markdown, render_terminal
+if TYPE_CHECKING:
+    from .models import QualityReport
+
+# DuckDB, rich and the validator are imported inside main(), so that `--help`
+# and argument errors return without paying their import cost.
+
+_SNAKE_RE = re.compile(r"[^a-zA-Z0-9]+")
+
 
 def _to_snake(name: str) -> str:
     """Convert a filename stem to snake_case for the auto report filename."""
-    name = re.sub(r"[^a-zA-Z0-9]+", "_", name).strip("_").lower()
+    name = _SNAKE_RE.sub("_", name).strip("_").lower()
     return name or "report"
 
 
+def _exit_code(report: QualityReport) -> int:
+    """Exit codes:
+      0 = no blockers and no major issues
+      1 = major issues (usable with caution)
+      2 = blocker (unusable)
+    """
+    if report.has_blockers:
+        return 2
+    return 1 if report.majors else 0
+
+
 app = typer.Typer(
     name="odq-csv",
     help="Open data quality validator for CSV files (phases 0–4).",
     add_completion=False,
+    rich_markup_mode=None,  # plain Click help: no rich import for --help
 )
 
 
@@ -43,7 +62,12 @@ def main(
     output_md: Annotated[Optional[Path], typer.Option("--output-md", help="Write Markdown report to file")] = None,
     sample_rows: Annotated[int, typer.Option("--sample-rows", help="Max rows to sample for content checks")] = 50_000,
     quiet: Annotated[bool, typer.Option("--quiet", "-q", help="Suppress terminal output (useful with --output-*)")] = False,
+    auto_md: Annotated[bool, typer.Option("--auto-md/--no-auto-md", help="Write ./open-data-quality/<name>.md")] = True,
 ) -> None:
+    from rich.console import Console
+
+    from .csv_validator import CsvValidator
+
     console = Console(stderr=False)
 
     if not quiet:
@@ -51,38 +75,43 @@ def main(
 
     validator = CsvValidator(csv_path=csv_file, sample_rows=sample_rows)
     report = validator.run()
+    if quiet and not (output_json or output_md or auto_md):
+        raise typer.Exit(code=_exit_code(report))   # exit code only: nothing to render
 
-    if not quiet:
-        render_terminal(report, console=console, show_ok=show_ok)
+    from .reporter import render_markdown, render_terminal, write_report_file
 
+    # Serialise here (pure Python, GIL-bound); only the file writes go to the pool,
+    # where they overlap with the terminal render.
+    writes: list[tuple[Path, bytes, str]] = []
     if output_json:
-        output_json.write_text(report.to_json(), encoding="utf-8")
-        if not quiet:
-            console.print(f"[dim]JSON report written to:[/dim] {output_json}")
+        writes.append((output_json, report.to_json_bytes(), "JSON report written to:"))
 
     # Auto-write markdown report to ./open-data-quality/<name>.md
-    auto_md_dir = Path.cwd() / "open-data-quality"
-    auto_md_dir.mkdir(exist_ok=True)
-    auto_md_path = auto_md_dir / f"{_to_snake(csv_file.stem)}.md"
-    auto_md_path.write_text(render_markdown(report, show_ok=show_ok), encoding="utf-8")
-    if not quiet:
-        console.print(f"[dim]Report:[/dim] {auto_md_path}")
-
-    if output_md:
-        output_md.write_text(render_markdown(report, show_ok=show_ok), encoding="utf-8")
+    auto_md_path = None
+    today = date.today().isoformat()   # same validation date in every rendering
+    if auto_md or output_md:
+        md_data = render_markdown(report, show_ok=show_ok, today=today).encode("utf-8")   # rendered once, written up to twice
+    if auto_md:
+        auto_md_dir = Path.cwd() / "open-data-quality"
+        auto_md_dir.mkdir(exist_ok=True)
+        auto_md_path = auto_md_dir / f"{_to_snake(csv_file.stem)}.md"
+        writes.append((auto_md_path, md_data, "Report:"))
+
+    if output_md and (auto_md_path is None or output_md.resolve() != auto_md_path.resolve()):
+        writes.append((output_md, md_data, "Markdown report written to:"))
+
+    with ThreadPoolExecutor(max_workers=max(1, len(writes))) as pool:
+        futures = [pool.submit(write_report_file, path, data) for path, data, _ in writes]
         if not quiet:
-            console.print(f"[dim]Markdown report written to:[/dim] {output_md}")
+            render_terminal(report, console=console, show_ok=show_ok, today=today)
+        for fut in futures:
+            fut.result()
 
-    # Exit codes:
-    #   0 = no blockers and no major issues
-    #   1 = major issues (usable with caution)
-    #   2 = blocker (unusable)
-    if report.has_blockers:
-        raise typer.Exit(code=2)
-    elif report.majors:
-        raise typer.Exit(code=1)
-    else:
-        raise typer.Exit(code=0)
+    if not quiet:
+        for path, _, label in writes:
+            console.print(f"[dim]{label}[/dim] {path}")
+
+    raise typer.Exit(code=_exit_code(report))
 
 
 if __name__ == "__main__":
@@ -10,15 +10,32 @@ and use DuckDB column names only for SQL queries on content (phases 3–4).
 
 from __future__ import annotations
 
+import codecs
 import csv as csvmod
 import io
+import os
 import re
+import string
+import sys
 import tempfile
 import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
 from charset_normalizer import from_bytes
 import duckdb
 
+try:  # optional accelerator: pip install "open-data-quality[fast]"
+    from chardet import detect as chardet_detect
+except ImportError:
+    chardet_detect = None
+
+try:  # optional: linear-time RE2 engine for patterns run over raw file lines
+    import re2 as line_re
+except ImportError:
+    line_re = re
+
 from .models import QualityReport, ScoreDimension, Severity
 
 # ── multilingual constants ────────────────────────────────────────────────────
@@ -40,10 +57,19 @@ PLACEHOLDER_VALUES = frozenset({
     "onbekend", "niet beschikbaar",
 })
 
-AGGREGATE_KEYWORDS = re.compile(
-    r"\b(totale?|subtotale?|grand total|total général|gesamt|insgesamt"
-    r"|suma total?|somma|subtotal|average|media|mittelwert|gemiddelde)\b",
-    re.IGNORECASE,
+# Patterns searched in raw file lines use RE2 when installed (flags inline, as the
+# RE2 binding takes no re flags); the sources are valid for both engines.
+# RE2's \b, \d and \s are ASCII-only, so the patterns spell out ASCII classes and
+# both engines agree. RE2 has no lookaround and re's \b is Unicode-aware, hence the
+# per-engine ASCII word boundary (outside the (?i:...) so case folding cannot widen it).
+_ASCII_WB_START, _ASCII_WB_END = (
+    (r"\b", r"\b") if line_re is not re else (r"(?<![0-9A-Za-z_])", r"(?![0-9A-Za-z_])")
+)
+AGGREGATE_KEYWORDS = line_re.compile(
+    _ASCII_WB_START
+    + r"(?i:(totale?|subtotale?|grand total|total général|gesamt|insgesamt"
+    r"|suma total?|somma|subtotal|average|media|mittelwert|gemiddelde))"
+    + _ASCII_WB_END
 )
 
 MONTH_NAMES = re.compile(
@@ -56,21 +82,125 @@ YEAR_COLUMN = re.compile(r"^(19|20)\d{2}$")
 
 ISO_DATETIME_PAT = re.compile(r"^\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2})?", re.IGNORECASE)
 
-FOOTNOTE_PAT = re.compile(r"\(\d+\)|\(\*\)|\d+\s*\*")
+# one digit is enough before "*" (no backtracking over digit runs); the blank class
+# (RE2's \s minus "\n") keeps the match inside one line, see _matching_lines()
+FOOTNOTE_PAT = line_re.compile(r"\([0-9]+\)|\(\*\)|[0-9][\t\f\r ]*\*")
+
+# column-name checks (phase 2): ASCII letters/digits, "_", "-" and À-ÿ are allowed.
+# Deleting them with str.translate leaves only the offending characters.
+NAME_LEGAL_CHARS = frozenset(string.ascii_letters + string.digits + "_-" + "".join(map(chr, range(0xC0, 0x100))))
+_NAME_LEGAL_DEL  = str.maketrans("", "", "".join(NAME_LEGAL_CHARS))
+
+# code value formats (phase 4)
+NUTS_PAT         = re.compile(r"^[A-Z]{2}[0-9A-Z]{1,3}$")
+ISTAT_COL_KEYS   = ("istat", "comune", "municipal")
+ISTAT_SHORT_PAT  = re.compile(r"^\d{1,5}$")
+ISTAT_FULL_PAT   = re.compile(r"^\d{6}$")
+COUNTRY_COL_KEYS = ("country_code", "iso_country", "nation")
+ISO_COUNTRY_PAT  = re.compile(r"^[A-Z]{2}$")
+
+# Cell-level patterns checked in phase 3 (DuckDB regexp syntax)
+_COMMA_DECIMAL_RE = r"^\d+,\d+$"
+_NON_ISO_DATE_RE  = r"^\d{1,2}[/.]\d{1,2}[/.]\d{4}$"
+_UNIT_IN_CELL_RE  = r"^\d+[.,]?\d*\s*(kg|km|EUR|%|ha|MW|GWh|tCO2|tn)\s*$"
+_THOUSANDS_RE     = r"^\d{1,3}([.,]\d{3})+$"
+# PLACEHOLDER_VALUES as one alternation, matched against lower(trim(val)) (trim()
+# also strips NBSP and other Unicode spaces, which a regex ' *' would not)
+_PLACEHOLDER_RE   = "^(" + "|".join(
+    re.escape(v) for v in sorted(PLACEHOLDER_VALUES, key=lambda v: (-len(v), v))
+) + ")$"
+
+# One pass over the unpivoted __odq_raw sample. Each pattern is evaluated once per
+# cell into a flag (within its row window), then aggregated per column.
+# {on} is the UNPIVOT column list (_ALL_RAW_COLUMNS unless columns are left out).
+# Parameters: (row limit, pattern) per flag, in order; see _pattern_params().
+_PATTERN_SQL = """
+    WITH long AS (UNPIVOT __odq_raw ON {on} INTO NAME col VALUE val),
+    flags AS (
+        SELECT col, val,
+            __odq_rn <= ? AND regexp_matches(val, ?)       AS is_comma,
+            __odq_rn <= ? AND regexp_matches(val, ?)       AS is_date,
+            __odq_rn <= ? AND regexp_matches(val, ?, 'i')  AS is_unit,
+            __odq_rn <= ? AND regexp_matches(lower(trim(val)), ?)  AS is_ph,
+            __odq_rn <= ? AND regexp_matches(val, ?)       AS is_th
+        FROM long
+    )
+    SELECT col,
+        COUNT(*) FILTER (WHERE is_comma), MIN(val) FILTER (WHERE is_comma),
+        COUNT(*) FILTER (WHERE is_date),  MIN(val) FILTER (WHERE is_date),
+        COUNT(*) FILTER (WHERE is_unit),  MIN(val) FILTER (WHERE is_unit),
+        COUNT(*) FILTER (WHERE is_ph),    list_distinct(list(lower(trim(val))) FILTER (WHERE is_ph)),
+        COUNT(*) FILTER (WHERE is_th)
+    FROM flags
+    GROUP BY col
+"""
+
+
+def _pattern_params(sample: int, short: int, th_rows: int) -> list:
+    """Bound parameters of _PATTERN_SQL: the patterns are never spliced into SQL text."""
+    return [
+        sample, _COMMA_DECIMAL_RE,
+        short, _NON_ISO_DATE_RE,
+        short, _UNIT_IN_CELL_RE,
+        sample, _PLACEHOLDER_RE,
+        th_rows, _THOUSANDS_RE,
+    ]
+
 
 # codes columns heuristic
-CODE_COL_PAT = re.compile(
-    r"(code|cod_|_code|_cod|nuts|lau|iso_|zip|postal|istat|ags|insee"
-    r"|gemeente|municipality|commune|gemeinde|municipio)",
-    re.IGNORECASE,
+# (plain substrings of the lowercased name: `in` is cheaper than a regex alternation)
+CODE_COL_KEYS = (
+    "code", "cod_", "_code", "_cod", "nuts", "lau", "iso_", "zip", "postal", "istat", "ags", "insee",
+    "gemeente", "municipality", "commune", "gemeinde", "municipio",
 )
 
 
+# Magic bytes of common non-CSV payloads (phase 0)
+_MAGIC: list[tuple[bytes, str]] = [
+    (b"PK\x03\x04", "ZIP archive"),
+    (b"PK\x05\x06", "ZIP archive"),
+    (b"%PDF",        "PDF document"),
+    (b"\xd0\xcf\x11\xe0", "OLE2/Excel document"),
+    (b"\xff\xfe",   "UTF-16 LE encoded file (not UTF-8 CSV)"),
+    (b"\xfe\xff",   "UTF-16 BE encoded file (not UTF-8 CSV)"),
+]
+
+_HEAD_BYTES = 8192  # phase 0 inspects only this many leading bytes for type sniffing
+_SNIFF_ROWS = 20480      # DuckDB's default sniffer sample_size (rows typed by DESCRIBE)
+_ALL_RAW_COLUMNS = "COLUMNS(* EXCLUDE (__odq_rn))"
+_PRESCAN_BYTES = 65536  # leading bytes read once for type, encoding, BOM, line endings and header
+_CHARDET_BYTES = 16384  # chardet needs less of the sample than charset-normalizer
+
+
 # ── file-level helpers ────────────────────────────────────────────────────────
 
-def _detect_encoding(path: Path) -> tuple[str, float]:
-    with open(path, "rb") as f:
-        raw = f.read(65536)
+def _is_non_csv_head(chunk: bytes) -> bool:
+    """True when the leading bytes alone already make phase 0 report a blocker.
+
+    ZIP archives are excluded: a CSV may be extracted from them, so the whole file is needed.
+    """
+    for sig, label in _MAGIC:
+        if chunk[:len(sig)] == sig:
+            return "ZIP" not in label
+    head = chunk[:512].decode("utf-8", errors="replace").lstrip()
+    if head.lower().startswith(("<!doctype", "<html", "<?xml")) or head.startswith(("{", "[")):
+        return True
+    return b"\x00" in chunk
+
+def _detect_encoding(raw: bytes) -> tuple[str, float]:
+    """Encoding of a leading byte sample (see ``_PRESCAN_BYTES``) and a 0–1 confidence."""
+    # Fast path: most files are valid UTF-8, which needs no statistical detection.
+    # The incremental decoder tolerates a multi-byte character cut at the buffer end.
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(raw, final=False)
+        return "utf-8", 1.0
+    except UnicodeDecodeError:
+        pass
+    if chardet_detect is not None:
+        res = chardet_detect(raw[:_CHARDET_BYTES])
+        if not res.get("encoding"):
+            return "unknown", 0.0
+        return res["encoding"].lower(), res["confidence"]
     results = from_bytes(raw)
     best = results.best()
     if best is None:
@@ -78,40 +208,123 @@ def _detect_encoding(path: Path) -> tuple[str, float]:
     return best.encoding.lower(), 1.0 - best.chaos
 
 
-def _has_bom(path: Path) -> bool:
-    with open(path, "rb") as f:
-        return f.read(3) == b"\xef\xbb\xbf"
+def _has_bom(head: bytes) -> bool:
+    return head.startswith(b"\xef\xbb\xbf")
 
 
-def _has_crlf(path: Path) -> bool:
-    with open(path, "rb") as f:
-        return b"\r\n" in f.read(16384)
+def _has_crlf(head: bytes) -> bool:
+    return b"\r\n" in head[:16384]
 
 
-def _read_raw_headers(path: Path, separator: str = ",") -> list[str]:
-    """Read column names directly from the first line of the file (no DuckDB rename)."""
+def _read_raw_headers(first_line: bytes, separator: str = ",") -> list[str]:
+    """Parse column names from the raw first line of the file (no DuckDB rename)."""
     try:
-        with open(path, "rb") as f:
-            # Skip BOM if present
-            start = f.read(3)
-            if start != b"\xef\xbb\xbf":
-                f.seek(0)
-            first_line = f.readline().decode("utf-8", errors="replace").rstrip("\r\n")
-        reader = csvmod.reader(io.StringIO(first_line), delimiter=separator)
+        line = first_line.removeprefix(b"\xef\xbb\xbf").decode("utf-8", errors="replace").rstrip("\r\n")
+        reader = csvmod.reader(io.StringIO(line), delimiter=separator)
         return next(reader, [])
     except Exception:
         return []
 
 
-def _tail_lines(path: Path, n: int = 10) -> list[str]:
+def _transcode_to_utf8(path: Path, encoding: str, chunk_size: int = 1 << 20) -> Path:
+    """Copy ``path`` into a new UTF-8 temp file, decoding ``encoding`` chunk by chunk.
+
+    Undecodable bytes become U+FFFD. Memory stays at one chunk whatever the file size.
+    """
+    name = codecs.lookup(encoding).name
+    tmp = tempfile.NamedTemporaryFile(suffix=".csv", delete=False)
     try:
-        lines = path.read_text(errors="replace").splitlines()
+        with tmp, open(path, "rb") as src:
+            if name in ("utf-16", "utf-32"):
+                # without a BOM the incremental decoder refuses to guess the byte order
+                # that a one-shot decode assumes (native), so name it explicitly
+                boms = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE) if name == "utf-16" else \
+                       (codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)
+                if not src.read(4).startswith(boms):
+                    encoding = f"{name}-{'le' if sys.byteorder == 'little' else 'be'}"
+                src.seek(0)
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            while chunk := src.read(chunk_size):
+                tmp.write(decoder.decode(chunk).encode("utf-8"))
+            tmp.write(decoder.decode(b"", final=True).encode("utf-8"))
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+    return Path(tmp.name)
+
+
+def _usable_cpus() -> int:
+    """CPUs available to this process (affinity-aware where the OS supports it)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def _sniffed_dialect(row: tuple, col_idx: dict, names: list[str], types: list[str]) -> str | None:
+    """read_csv options (auto_detect=false) rebuilt from a sniff_csv() row.
+
+    None when the sniffed columns differ from the DESCRIBE schema the phases query
+    with, or the row lacks a field: reads then keep auto-detection.
+    """
+    try:
+        columns = row[col_idx["Columns"]]
+        if [c["name"] for c in columns] != names or [c["type"] for c in columns] != types:
+            return None
+
+        def lit(key: str) -> str:
+            v = row[col_idx[key]]
+            v = "" if v is None or v == "(empty)" else str(v)
+            return "'" + v.replace("'", "''") + "'"
+
+        opts = [
+            "auto_detect=false",
+            f"delim={lit('Delimiter')}", f"quote={lit('Quote')}", f"escape={lit('Escape')}",
+            f"new_line={lit('NewLineDelimiter')}", f"comment={lit('Comment')}",
+            f"skip={int(row[col_idx['SkipRows']])}",
+            f"header={str(bool(row[col_idx['HasHeader']])).lower()}",
+        ]
+        for key, opt in (("DateFormat", "dateformat"), ("TimestampFormat", "timestampformat")):
+            if row[col_idx[key]]:
+                opts.append(f"{opt}={lit(key)}")
+        return ", ".join(opts)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+def _tail_lines(path: Path, n: int = 10, block: int = 8192, head: bytes | None = None) -> list[str]:
+    """Last ``n`` lines, reading backwards in blocks (like ``tail -n``) instead of the whole file.
+
+    When ``head`` (the prescan buffer) already holds the whole file, no read is needed.
+    """
+    if head is not None and len(head) < _PRESCAN_BYTES:
+        return head.decode("utf-8", errors="replace").splitlines()[-n:]
+    try:
+        with open(path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            data = b""
+            while pos > 0 and data.count(b"\n") <= n:
+                step = min(block, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        if pos > 0:
+            lines = lines[1:]   # first line may start mid-line
         return lines[-n:]
     except Exception:
         return []
 
 
-def _head_lines(path: Path, n: int = 200) -> list[str]:
+def _head_lines(path: Path, n: int = 200, head: bytes | None = None) -> list[str]:
+    """First ``n`` lines; taken from ``head`` (the prescan buffer) when it holds them all."""
+    if head is not None:
+        lines = head.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        if len(head) < _PRESCAN_BYTES:   # the whole file is in the buffer
+            if lines[-1] == "":
+                lines.pop()
+            return lines[:n]
+        if len(lines) > n:               # the last (possibly cut) line is not needed
+            return lines[:n]
     try:
         lines = []
         with open(path, errors="replace") as f:
@@ -124,6 +337,31 @@ def _head_lines(path: Path, n: int = 200) -> list[str]:
         return []
 
 
+def _matching_lines(pat: re.Pattern, lines: list[str]) -> list[str]:
+    """Lines that ``pat`` finds a match in.
+
+    One search over the joined text settles the common no-match case in a single
+    call; ``pat`` must not be able to match across a newline.
+    """
+    if not pat.search("\n".join(lines)):
+        return []
+    return list(filter(pat.search, lines))
+
+
+def _column_name_problem(name: str) -> str | None:
+    """Why a column name is not SQL-friendly ("space", "special chars", "starts with digit"), or None."""
+    if name.translate(_NAME_LEGAL_DEL):
+        return "space" if " " in name else "special chars"
+    if name[:1].isdecimal():
+        return "starts with digit"
+    return None
+
+
+def _has_code_format_check(col_lower: str) -> bool:
+    """True when phase 4 validates the values of a code column with this (lowercased) name."""
+    return "nuts" in col_lower or any(k in col_lower for k in ISTAT_COL_KEYS + COUNTRY_COL_KEYS)
+
+
 # ── main validator ────────────────────────────────────────────────────────────
 
 class CsvValidator:
@@ -135,26 +373,139 @@ class CsvValidator:
     P3 = "phase3_content"
     P4 = "phase4_codes"
 
+    # dimension -> (max points, {finding code: penalty})
+    _SCORE_PENALTIES: dict[str, tuple[int, dict[str, int]]] = {
+        "File format compliance": (15, {
+            "encoding_not_utf8": 10,
+            "bom_present":        5,
+            "no_header":          3,
+        }),
+        "Data structure quality": (20, {
+            "wide_format_years":  5,
+            "wide_format_months": 5,
+            "duplicate_columns":  5,
+            "aggregate_rows":     5,
+            "bad_column_names":   3,
+            "footnote_markers":   2,
+        }),
+        "Data content quality": (25, {
+            "comma_decimal":           5,
+            "non_iso_date":            5,
+            "high_null_rate":          5,
+            "units_in_cells":          3,
+            "placeholder_values":      3,
+            "invalid_reference_codes": 4,
+            "numeric_as_varchar":      2,
+            "fuzzy_category_values":   2,
+            "duplicate_rows":          3,
+            "outlier_values":          2,
+        }),
+    }
+
     def __init__(self, csv_path: Path, sample_rows: int = 50_000):
         self.path = Path(csv_path)
         self.sample_rows = sample_rows
         self.report = QualityReport(source=str(csv_path))
         self._con: duckdb.DuckDBPyConnection | None = None
-        self._duckdb_columns: list[dict] = []   # DuckDB-renamed column names + types
+        self._duck_names: list[str] = []        # DuckDB-renamed column names ...
+        self._duck_types: list[str] = []        # ... and their types, by position
         self._raw_headers: list[str] = []       # original headers from file
+        self._raw_to_duck: dict[str, str] = {}  # raw header -> DuckDB column name (by position)
         self._row_count: int = 0
         self._separator: str = ","
         self._lenient: bool = False             # True when strict_mode=false is needed
         self._orig_path: Path | None = None    # set when a UTF-8 temp copy replaces self.path
         self._zip_extracted: Path | None = None  # set when a CSV was extracted from a ZIP
-
-    def _rcsv(self, path, opts: str = "") -> str:
-        """Build a read_csv_auto() SQL expression, adding strict_mode=false when needed."""
-        parts = [opts] if opts else []
+        self.spooled_bytes: int | None = None    # set by from_stream(): bytes written to the temp file
+        self._head_cache: tuple[Path, bytes] | None = None  # (path, first _PRESCAN_BYTES bytes)
+        self._csv_dialect: str | None = None     # sniffed read_csv options, set by phase 1
+        self._encoding_cache: tuple[Path, str, float] | None = None  # (path, encoding, confidence)
+
+    @classmethod
+    def from_stream(cls, chunks: Iterable[bytes], sample_rows: int = 50_000,
+                    size_hint: int | None = None) -> CsvValidator:
+        """Spool a byte stream (e.g. an HTTP download) to a temp file and return a validator for it.
+
+        The first bytes are sniffed before the rest is consumed: if they already identify
+        the payload as non-CSV (HTML error page, PDF, Excel, JSON, binary), the stream is
+        abandoned and only the head is kept — phase 0 reaches the same blocker from it.
+        ``size_hint`` (e.g. Content-Length) lets the temp file be allocated up front, so
+        large downloads are not fragmented by block-by-block growth.
+        The caller owns the temp file at ``validator.path`` and should delete it when done.
+        """
+        it = iter(chunks)
+        head = b""
+        for chunk in it:
+            head += chunk
+            if len(head) >= _HEAD_BYTES:
+                break
+        # Buffered on purpose: BufferedWriter retries short writes (raw FileIO does not),
+        # and chunks larger than its buffer are passed straight to the OS without a copy.
+        tmp = tempfile.NamedTemporaryFile(suffix=".csv", delete=False)
+        try:
+            with tmp:
+                if size_hint and size_hint > _HEAD_BYTES and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(tmp.fileno(), 0, size_hint)
+                    except OSError:
+                        pass   # unsupported by the filesystem: grow as we write
+                tmp.write(head)
+                if not _is_non_csv_head(head[:_HEAD_BYTES]):
+                    tmp.writelines(it)
+                size = tmp.tell()
+                if size_hint and size != size_hint:
+                    tmp.truncate(size)   # short stream / early stop: no trailing NULs
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+        validator = cls(Path(tmp.name), sample_rows=sample_rows)
+        validator.spooled_bytes = size
+        return validator
+
+    def _head(self) -> bytes:
+        """Leading bytes of ``self.path``, read once per path (phase 0 may swap the path)."""
+        if self._head_cache is None or self._head_cache[0] != self.path:
+            with open(self.path, "rb") as f:
+                self._head_cache = (self.path, f.read(_PRESCAN_BYTES))
+        return self._head_cache[1]
+
+    def _encoding(self) -> tuple[str, float]:
+        """``_detect_encoding`` of ``_head()``, computed once per path."""
+        if self._encoding_cache is None or self._encoding_cache[0] != self.path:
+            self._encoding_cache = (self.path, *_detect_encoding(self._head()))
+        return self._encoding_cache[1:]
+
+    def _first_line(self) -> bytes:
+        head = self._head()
+        nl = head.find(b"\n")
+        if nl >= 0:
+            return head[:nl + 1]
+        if len(head) < _PRESCAN_BYTES:
+            return head
+        with open(self.path, "rb") as f:   # header longer than the prescan buffer
+            return f.readline()
+
+    def _rcsv(self, all_varchar: bool = False) -> str:
+        """Build a read_csv SQL expression, adding strict_mode=false when needed.
+
+        Once phase 1 has sniffed the dialect, reads reuse it with the phase 0 schema
+        (auto_detect=false), so DuckDB does not sniff the file again on every query.
+        The path is a bound parameter: pass ``[str(path)]`` to execute().
+        """
+        if self._csv_dialect is None:
+            parts = ["all_varchar=true"] if all_varchar else []
+            func = "read_csv_auto"
+        else:
+            types = ["VARCHAR"] * len(self._duck_types) if all_varchar else self._duck_types
+            columns = ", ".join(
+                f"'{name.replace(chr(39), chr(39) * 2)}': '{t}'" for name, t in zip(self._duck_names, types)
+            )
+            parts = [self._csv_dialect, f"columns={{{columns}}}"]
+            func = "read_csv"
         if self._lenient:
             parts.append("strict_mode=false")
         suffix = (", " + ", ".join(parts)) if parts else ""
-        return f"read_csv_auto('{path}'{suffix})"
+        return f"{func}(?{suffix})"
 
     def _extract_csv_from_zip(self, zip_path: Path) -> Path | None:
         """Extract the largest CSV from a ZIP archive to a temp file. Returns path or None."""
@@ -176,14 +527,18 @@ class CsvValidator:
             return None
 
     def run(self) -> QualityReport:
-        self._phase0_blockers()
-        if self.report.has_blockers:
-            self.report.dimensions.append(ScoreDimension("File format compliance", 15, 0))
-            self.report.dimensions.append(ScoreDimension("Data structure quality", 20, 0))
-            self.report.dimensions.append(ScoreDimension("Data content quality", 25, 0))
-            return self.report
-        self._con = duckdb.connect()
+        # One connection for every phase. Threads follow the CPUs this process may run
+        # on (cgroup/affinity limits included); no progress bar on a CLI's stdout.
+        self._con = duckdb.connect(config={"threads": _usable_cpus()})
+        self._con.execute("SET enable_progress_bar = false")
         try:
+            self._phase0_blockers()
+            if self.report.has_blockers:
+                self.report.dimensions.extend(
+                    ScoreDimension(name, max_pts, 0)
+                    for name, (max_pts, _) in self._SCORE_PENALTIES.items()
+                )
+                return self.report
             self._phase1_structure()
             self._phase2_columns()
             self._phase3_content()
@@ -205,23 +560,16 @@ class CsvValidator:
     def _phase0_blockers(self) -> None:
         r, p = self.report, self.P0
 
-        if not self.path.exists():
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
             r.blocker(p, "file_not_found", f"File not found: {self.path}"); return
-        if self.path.stat().st_size == 0:
+        if size == 0:
             r.blocker(p, "file_empty", "File is empty (0 bytes)"); return
 
-        with open(self.path, "rb") as f:
-            chunk = f.read(8192)
+        chunk = self._head()[:_HEAD_BYTES]
 
         # Detect common non-CSV file types via magic bytes / content sniffing
-        _MAGIC: list[tuple[bytes, str]] = [
-            (b"PK\x03\x04", "ZIP archive"),
-            (b"PK\x05\x06", "ZIP archive"),
-            (b"%PDF",        "PDF document"),
-            (b"\xd0\xcf\x11\xe0", "OLE2/Excel document"),
-            (b"\xff\xfe",   "UTF-16 LE encoded file (not UTF-8 CSV)"),
-            (b"\xfe\xff",   "UTF-16 BE encoded file (not UTF-8 CSV)"),
-        ]
         for sig, label in _MAGIC:
             if chunk[:len(sig)] == sig:
                 if "ZIP" in label:
@@ -234,8 +582,7 @@ class CsvValidator:
                                 detail="The declared CSV resource is packaged inside a ZIP. "
                                        "The largest CSV found in the archive was extracted and validated.",
                                 fix="Publish the CSV file directly, without ZIP wrapping")
-                        with open(self.path, "rb") as f:
-                            chunk = f.read(8192)
+                        chunk = self._head()[:_HEAD_BYTES]
                         break
                     else:
                         r.blocker(p, "file_wrong_type",
@@ -253,29 +600,11 @@ class CsvValidator:
             r.blocker(p, "file_binary", "File appears binary (null bytes) — not a CSV"); return
 
         try:
-            con = duckdb.connect()
-            row = con.execute(
-                f"SELECT COUNT(*) FROM read_csv_auto('{self.path}', sample_size=1000)"
-            ).fetchone()
-            rows = row[0] if row else 0
-            cols_info = con.execute(
-                f"DESCRIBE SELECT * FROM read_csv_auto('{self.path}', sample_size=1)"
-            ).fetchall()
-            cols = len(cols_info)
-            con.close()
+            rows, schema = self._count_and_describe(self.path)
         except Exception:
             # Retry 1: strict_mode=false (handles quoted newlines in headers, etc.)
             try:
-                con = duckdb.connect()
-                row = con.execute(
-                    f"SELECT COUNT(*) FROM read_csv_auto('{self.path}', sample_size=1000, strict_mode=false)"
-                ).fetchone()
-                rows = row[0] if row else 0
-                cols_info = con.execute(
-                    f"DESCRIBE SELECT * FROM read_csv_auto('{self.path}', sample_size=1, strict_mode=false)"
-                ).fetchall()
-                cols = len(cols_info)
-                con.close()
+                rows, schema = self._count_and_describe(self.path, lenient=True)
                 self._lenient = True
                 r.minor(p, "csv_needs_lenient_parsing",
                         "File required lenient parsing (quoted newlines or minor formatting issues)",
@@ -283,23 +612,15 @@ class CsvValidator:
             except Exception:
                 # Retry 2: detect encoding, convert to UTF-8 temp file and re-parse
                 try:
-                    enc, _conf = _detect_encoding(self.path)
+                    enc, _conf = self._encoding()
                     if enc in ("utf-8", "utf8", "ascii", "unknown"):
                         raise ValueError("Could not parse despite UTF-8/unknown encoding")
-                    tmp = Path(tempfile.mktemp(suffix=".csv"))
-                    with open(self.path, "rb") as f:
-                        raw = f.read()
-                    tmp.write_text(raw.decode(enc, errors="replace"), encoding="utf-8")
-                    con = duckdb.connect()
-                    row = con.execute(
-                        f"SELECT COUNT(*) FROM read_csv_auto('{tmp}', sample_size=1000)"
-                    ).fetchone()
-                    rows = row[0] if row else 0
-                    cols_info = con.execute(
-                        f"DESCRIBE SELECT * FROM read_csv_auto('{tmp}', sample_size=1)"
-                    ).fetchall()
-                    cols = len(cols_info)
-                    con.close()
+                    tmp = _transcode_to_utf8(self.path, enc)
+                    try:
+                        rows, schema = self._count_and_describe(tmp)
+                    except Exception:
+                        tmp.unlink(missing_ok=True)
+                        raise
                     self._orig_path = self.path
                     self.path = tmp   # all subsequent phases analyse the UTF-8 copy
                     r.major(p, "encoding_not_utf8",
@@ -309,6 +630,7 @@ class CsvValidator:
                     r.blocker(p, "csv_unparseable", f"DuckDB cannot parse file: {e}",
                               fix="Check separator, quoting, and encoding"); return
 
+        cols = len(schema)
         if rows == 0:
             r.blocker(p, "no_data_rows", "No data rows (header only or empty)"); return
         if cols <= 1:
@@ -317,6 +639,23 @@ class CsvValidator:
 
         r.ok(p, "parseable", f"Parsed OK: {rows:,} rows × {cols} columns")
         self._row_count = rows
+        # DuckDB schema (renamed columns), reused by phases 1–4
+        self._duck_names = [row[0] for row in schema]
+        self._duck_types = [row[1] for row in schema]
+
+    def _count_and_describe(self, path: Path, lenient: bool = False) -> tuple[int, list]:
+        """Row count and DESCRIBE rows for ``path``, read on the shared connection.
+
+        DESCRIBE uses the default sniffing sample, the same schema later phases query with.
+        """
+        opts = ", strict_mode=false" if lenient else ""
+        row = self._con.execute(
+            f"SELECT COUNT(*) FROM read_csv_auto(?, sample_size=1000{opts})", [str(path)]
+        ).fetchone()
+        schema = self._con.execute(
+            f"DESCRIBE SELECT * FROM read_csv_auto(?{opts})", [str(path)]
+        ).fetchall()
+        return (row[0] if row else 0), schema
 
     # ── Phase 1: file structure ──────────────────────────────────────────
 
@@ -325,7 +664,7 @@ class CsvValidator:
 
         # Encoding — skip if Phase 0 already detected and flagged non-UTF-8
         if self._orig_path is None:
-            enc, conf = _detect_encoding(self.path)
+            enc, conf = self._encoding()
             enc_norm = enc.replace("_", "-").lower()
             is_utf8 = enc_norm in ("utf-8", "utf-8-sig", "ascii", "us-ascii")
             if is_utf8:
@@ -336,41 +675,37 @@ class CsvValidator:
                         fix=f"iconv -f {enc_norm} -t UTF-8 input.csv > output.csv")
 
         # BOM
-        if _has_bom(self.path):
+        if _has_bom(self._head()):
             r.major(p, "bom_present", "UTF-8 BOM present — causes parse errors in many tools",
                     fix="sed '1s/^\\xef\\xbb\\xbf//' input.csv > output.csv")
         else:
             r.ok(p, "no_bom", "No BOM")
 
         # Line endings — RFC 4180 prescribes CRLF; both CRLF and LF are accepted
-        if _has_crlf(self.path):
+        if _has_crlf(self._head()):
             r.ok(p, "crlf_endings", "CRLF line endings (RFC 4180 standard)")
         else:
             r.ok(p, "lf_endings", "LF line endings (Unix-style)")
 
         # Separator detection via DuckDB sniff_csv
         try:
-            cur = self._con.execute(f"SELECT * FROM sniff_csv('{self.path}')")
+            cur = self._con.execute("SELECT * FROM sniff_csv(?)", [str(self.path)])
             col_idx = {d[0]: i for i, d in enumerate(cur.description)}
             row = cur.fetchone()
             if row:
                 self._separator = str(row[col_idx.get("Delimiter", 0)] or ",")
+                self._csv_dialect = _sniffed_dialect(row, col_idx, self._duck_names, self._duck_types)
                 if not row[col_idx.get("HasHeader", 0)]:
                     r.major(p, "no_header", "No header row detected",
                             fix="Add a descriptive header row as the first line")
         except Exception:
             self._separator = ","
 
-        # DuckDB schema (renamed columns)
-        schema = self._con.execute(
-            f"DESCRIBE SELECT * FROM {self._rcsv(self.path)}"
-        ).fetchall()
-        self._duckdb_columns = [{"name": row[0], "type": row[1]} for row in schema]
-
         # Raw headers from file (preserves original names, including digit-only like '2020')
-        self._raw_headers = _read_raw_headers(self.path, self._separator)
+        self._raw_headers = _read_raw_headers(self._first_line(), self._separator)
+        self._raw_to_duck = dict(zip(self._raw_headers, self._duck_names))
 
-        ncols = len(self._raw_headers) or len(self._duckdb_columns)
+        ncols = len(self._raw_headers) or len(self._duck_names)
         r.ok(p, "separator", f"Separator: {self._separator!r}")
         r.ok(p, "dimensions", f"{self._row_count:,} rows × {ncols} columns")
 
@@ -380,13 +715,10 @@ class CsvValidator:
         r, p = self.report, self.P2
 
         # Use raw headers for structural/naming checks
-        names = self._raw_headers or [c["name"] for c in self._duckdb_columns]
+        names = self._raw_headers or self._duck_names
 
         # Duplicate column names
-        seen: dict[str, int] = {}
-        for n in names:
-            seen[n] = seen.get(n, 0) + 1
-        dupes = [n for n, c in seen.items() if c > 1]
+        dupes = [n for n, c in Counter(names).items() if c > 1]
         if dupes:
             r.major(p, "duplicate_columns", f"Duplicate column names: {dupes}",
                     fix="Rename duplicates before publishing")
@@ -394,14 +726,7 @@ class CsvValidator:
             r.ok(p, "no_duplicate_columns", "No duplicate column names")
 
         # Problematic column names
-        bad = []
-        for name in names:
-            if " " in name:
-                bad.append(f"{name!r} (space)")
-            elif re.search(r"[^a-zA-Z0-9_À-ÿ\-]", name):
-                bad.append(f"{name!r} (special chars)")
-            elif re.match(r"^\d", name):
-                bad.append(f"{name!r} (starts with digit)")
+        bad = [f"{name!r} ({why})" for name in names if (why := _column_name_problem(name))]
         if bad:
             r.minor(p, "bad_column_names",
                     f"{len(bad)} column(s) with non-SQL-friendly names",
@@ -428,7 +753,7 @@ class CsvValidator:
             r.ok(p, "no_wide_format", "No wide-format time-period columns")
 
         # Aggregate/total rows (last 10 lines)
-        agg = [l for l in _tail_lines(self.path) if AGGREGATE_KEYWORDS.search(l)]
+        agg = _matching_lines(AGGREGATE_KEYWORDS, _tail_lines(self.path, head=self._head()))
         if agg:
             r.major(p, "aggregate_rows",
                     f"{len(agg)} aggregate/total row(s) at end of file",
@@ -438,7 +763,7 @@ class CsvValidator:
             r.ok(p, "no_aggregate_rows", "No aggregate rows at end of file")
 
         # Footnote markers leaking from Excel (first 200 lines)
-        fn = [l for l in _head_lines(self.path) if FOOTNOTE_PAT.search(l)]
+        fn = _matching_lines(FOOTNOTE_PAT, _head_lines(self.path, head=self._head()))
         if fn:
             r.minor(p, "footnote_markers",
                     f"Footnote markers (*), (1) in {len(fn)} sampled line(s)",
@@ -452,41 +777,151 @@ class CsvValidator:
         path = self.path
         sample = self.sample_rows
 
-        # SUMMARIZE for null rates — pure DuckDB, no pandas
-        try:
-            cur = self._con.execute(
-                f"SUMMARIZE SELECT * FROM {self._rcsv(path)} LIMIT {sample}"
-            )
-            col_idx = {d[0]: i for i, d in enumerate(cur.description)}
-            rows = cur.fetchall()
-            r.ok(p, "summarize_ok", "DuckDB SUMMARIZE completed")
-            self._check_null_rates(rows, col_idx, p)
-        except Exception as e:
-            r.minor(p, "summarize_failed", f"SUMMARIZE failed: {e}")
-
-        # Verify the file can be loaded as all-varchar (needed for pattern checks)
+        # Load the all-varchar sample once for every content check. Phase 4 takes its
+        # 5000 values per code column from these rows too, so on a sparse column in a
+        # longer file it sees fewer than 5000. __odq_rn numbers rows in file order. Sample
+        # tables live in the main schema of the per-run in-memory database (not TEMP)
+        # so sibling cursors can read them.
         try:
-            self._con.execute(
-                f"SELECT COUNT(*) FROM {self._rcsv(path, 'all_varchar=true')} LIMIT 1"
-            ).fetchone()
+            self._con.execute(f"""
+                CREATE OR REPLACE TABLE __odq_raw AS
+                SELECT row_number() OVER () AS __odq_rn, *
+                FROM (SELECT * FROM {self._rcsv(all_varchar=True)} LIMIT {max(sample, 5000)})
+            """, [str(path)])
         except Exception:
             r.minor(p, "varchar_load_failed", "Could not load data for content checks")
             return
 
-        # ── Duplicate rows ───────────────────────────────────────────────
+        # Null rates from one count(*)/count(col) pass over the sample: empty fields
+        # are NULL in the all-varchar read just as in the typed one.
+        sample_rows = 0
         try:
-            dup_result = self._con.execute(f"""
+            cur = self._con.execute(
+                f"SELECT count(*), count(COLUMNS(* EXCLUDE (__odq_rn))) FROM __odq_raw WHERE __odq_rn <= {sample}"
+            )
+            names = [d[0] for d in cur.description[1:]]
+            sample_rows, *non_null = cur.fetchone()
+            r.ok(p, "summarize_ok", "Null-rate profile completed")
+            self._check_null_rates(names, non_null, sample_rows, p)
+        except Exception as e:
+            r.minor(p, "summarize_failed", f"Null-rate profile failed: {e}")
+
+        numeric_types = {"BIGINT", "INTEGER", "SMALLINT", "TINYINT", "HUGEINT",
+                         "DOUBLE", "FLOAT", "REAL", "DECIMAL", "NUMERIC"}
+        numeric_cols = [
+            n for n, t in zip(self._duck_names, self._duck_types)
+            if any(t.upper().startswith(k) for k in numeric_types)
+        ]
+        num_cols = numeric_cols if sample_rows >= 100 else []   # outliers need >= 100 values: skip tiny files
+
+        # The typed sample is only needed for the outlier check, so the second parse
+        # of the CSV is skipped when there is no numeric column to test. Outliers are
+        # computed over the non-null values within these first `sample` rows.
+        if num_cols:
+            try:
+                self._con.execute(
+                    f"CREATE OR REPLACE TABLE __odq_typed AS SELECT * FROM {self._rcsv()} LIMIT {sample}",
+                    [str(path)],
+                )
+            except Exception:
+                num_cols = []
+
+        varchar_cats = [n for n, t in zip(self._duck_names, self._duck_types) if t in ("VARCHAR", "TEXT")]
+        varchar_typed = set(varchar_cats)
+
+        # Whole-file checks below only read VARCHAR columns: when the file is smaller
+        # than the sample, __odq_raw already holds every row with the same values, so
+        # scan it instead of parsing the CSV again.
+        if 0 < sample_rows < sample:
+            full_src, full_args = "__odq_raw", []
+        else:
+            full_src, full_args = self._rcsv(), [str(path)]
+
+        # The checks below only read the sample tables (or the CSV), so their queries
+        # are submitted together and run on sibling cursors; findings are still
+        # recorded in the usual order.
+        # Each check keeps its own row window (dates/units: first 500 rows,
+        # thousands separators: first 200), selected by row number in the sample.
+        short, th_rows = min(sample, 500), 200
+        # Numeric and boolean values cannot match any cell pattern, but their type is
+        # only proven for the rows DuckDB sniffed: when that is the whole file, those
+        # columns are left out of the UNPIVOT.
+        on = _ALL_RAW_COLUMNS
+        if self._row_count <= _SNIFF_ROWS:
+            skip = set(numeric_cols) | {n for n, t in zip(self._duck_names, self._duck_types) if t == "BOOLEAN"}
+            if skip:
+                on = ", ".join('"' + n.replace('"', '""') + '"' for n in self._duck_names if n not in skip)
+        queries: dict[object, tuple[str, list]] = {
+            "dup": (f"""
                 WITH raw AS (
-                    SELECT * FROM {self._rcsv(path, 'all_varchar=true')} LIMIT {sample}
+                    SELECT * EXCLUDE (__odq_rn) FROM __odq_raw WHERE __odq_rn <= {sample}
                 ),
                 deduped AS (SELECT DISTINCT * FROM raw)
                 SELECT
                     (SELECT COUNT(*) FROM raw) AS total_rows,
                     (SELECT COUNT(*) FROM raw) - (SELECT COUNT(*) FROM deduped) AS duplicate_rows
-            """).fetchone()
-        except Exception:
-            dup_result = None
-        if dup_result and dup_result[1] and dup_result[1] > 0:
+            """, []),
+        }
+        if on:
+            queries["patterns"] = (_PATTERN_SQL.replace("{on}", on), _pattern_params(sample, short, th_rows))
+        if varchar_cats:
+            # Whitespace and fuzzy-match candidates for every VARCHAR column in one scan
+            # of the source (the whole CSV on large files): per column, whether any value
+            # has leading/trailing whitespace, and the 80 most frequent trimmed values
+            # (longer than 3 characters) seen at least twice.
+            cols = ", ".join(f'"{col}"' for col in varchar_cats[:20])
+            queries["categories"] = (f"""
+                WITH long AS (
+                    UNPIVOT (SELECT {cols} FROM {full_src}) ON COLUMNS(*) INTO NAME col VALUE v
+                ),
+                freq AS (
+                    SELECT col, trim(v) AS v, COUNT(*) AS n, bool_or(long.v != trim(long.v)) AS ws
+                    FROM long
+                    GROUP BY col, trim(long.v)
+                )
+                SELECT col, bool_or(ws),
+                       (list(v ORDER BY n DESC, v) FILTER (WHERE n >= 2 AND length(v) > 3))[1:80]
+                FROM freq GROUP BY col
+            """, full_args)
+        for col in num_cols[:10]:
+            queries[("outlier", col)] = (f"""
+                WITH data AS (
+                    SELECT "{col}"::DOUBLE AS v
+                    FROM __odq_typed
+                    WHERE "{col}" IS NOT NULL
+                ),
+                bounds AS (
+                    SELECT
+                        percentile_cont(0.25) WITHIN GROUP (ORDER BY v) AS q1,
+                        percentile_cont(0.75) WITHIN GROUP (ORDER BY v) AS q3
+                    FROM data
+                )
+                SELECT
+                    (SELECT COUNT(*) FROM data) AS total,
+                    (SELECT COUNT(*) FROM data, bounds
+                     WHERE (q3 - q1) > 0
+                       AND (v < q1 - 1.5*(q3-q1) OR v > q3 + 1.5*(q3-q1))) AS n_out,
+                    (SELECT MAX(v) FROM data, bounds
+                     WHERE (q3 - q1) > 0
+                       AND v > q3 + 1.5*(q3-q1)) AS high_ex
+                FROM bounds
+            """, [])
+        results = self._fetch_parallel(queries)
+        # A failed query must not read as a clean result: its checks record no "ok"
+        # finding and are listed in one check_failed finding at the end.
+        failed: list[str] = []
+        patterns_ok = results.get("patterns", ()) is not None
+        categories_ok = results.get("categories", ()) is not None
+        if not patterns_ok:
+            failed += ["comma decimal", "non-ISO dates", "units in cells", "placeholders", "thousands separators"]
+        if not categories_ok:
+            failed += ["whitespace in values", "near-duplicate categories"]
+
+        # ── Duplicate rows ───────────────────────────────────────────────
+        dup_result = (results["dup"] or [None])[0]
+        if results["dup"] is None:
+            failed.append("duplicate rows")
+        elif dup_result and dup_result[1] and dup_result[1] > 0:
             total, dupes = dup_result
             pct = dupes / total * 100 if total else 0
             r.major(p, "duplicate_rows",
@@ -496,80 +931,44 @@ class CsvValidator:
         else:
             r.ok(p, "no_duplicate_rows", "No exact duplicate rows detected")
 
+        # ── Cell pattern checks: one UNPIVOT pass over the all-varchar sample ──
+        pattern_rows = results.get("patterns") or []
+        col_pos = {name: i for i, name in enumerate(self._duck_names)}
+        pattern_rows.sort(key=lambda row: col_pos.get(row[0], len(col_pos)))
+
         # ── Comma decimal separator ──────────────────────────────────────
-        try:
-            comma_rows = self._con.execute(f"""
-                SELECT col, COUNT(*) AS hits, MIN(val) AS example
-                FROM (UNPIVOT (
-                    SELECT * FROM {self._rcsv(path, 'all_varchar=true')} LIMIT {sample}
-                ) ON COLUMNS(*) INTO NAME col VALUE val)
-                WHERE regexp_matches(val, '^\\d+,\\d+$')
-                GROUP BY col HAVING COUNT(*) >= 3
-            """).fetchall()
-        except Exception:
-            comma_rows = []
+        comma_rows = [(row[0], row[1], row[2]) for row in pattern_rows if row[1] >= 3]
         if comma_rows:
             r.major(p, "comma_decimal",
                     f"Comma decimal separator in {len(comma_rows)} column(s): {[row[0] for row in comma_rows]}",
                     detail="; ".join(f"{row[0]}: e.g. {row[2]!r}" for row in comma_rows[:3]),
                     fix="mlr --csv put 'for(k,v in $*){{if(v=~\"^[0-9]+,[0-9]+$\"){{$[k]=sub(v,\",\",\".\")}}}}' data.csv")
-        else:
+        elif patterns_ok:
             r.ok(p, "no_comma_decimal", "No comma decimal separator detected")
 
         # ── Non-ISO date format ──────────────────────────────────────────
-        try:
-            date_rows = self._con.execute(f"""
-                SELECT col, COUNT(*) AS hits, MIN(val) AS example
-                FROM (UNPIVOT (
-                    SELECT * FROM {self._rcsv(path, 'all_varchar=true')} LIMIT {min(sample, 500)}
-                ) ON COLUMNS(*) INTO NAME col VALUE val)
-                WHERE regexp_matches(val, '^\\d{{1,2}}[/.]\\d{{1,2}}[/.]\\d{{4}}$')
-                GROUP BY col HAVING COUNT(*) >= 2
-            """).fetchall()
-        except Exception:
-            date_rows = []
+        date_rows = [(row[0], row[3], row[4]) for row in pattern_rows if row[3] >= 2]
         if date_rows:
             r.major(p, "non_iso_date",
                     f"Non-ISO date format in {len(date_rows)} column(s): {[row[0] for row in date_rows]}",
                     detail="; ".join(f"{row[0]}: e.g. {row[2]!r}" for row in date_rows[:3]),
                     fix="duckdb: strptime(col,'%d/%m/%Y')::DATE")
-        else:
+        elif patterns_ok:
             r.ok(p, "iso_dates", "No non-ISO date formats detected")
 
         # ── Units in numeric cells ───────────────────────────────────────
-        try:
-            unit_rows = self._con.execute(f"""
-                SELECT col, COUNT(*) AS hits, MIN(val) AS example
-                FROM (UNPIVOT (
-                    SELECT * FROM {self._rcsv(path, 'all_varchar=true')} LIMIT {min(sample, 500)}
-                ) ON COLUMNS(*) INTO NAME col VALUE val)
-                WHERE regexp_matches(val, '^\\d+[.,]?\\d*\\s*(kg|km|EUR|%|ha|MW|GWh|tCO2|tn)\\s*$', 'i')
-                GROUP BY col HAVING COUNT(*) >= 2
-            """).fetchall()
-        except Exception:
-            unit_rows = []
+        unit_rows = [(row[0], row[5], row[6]) for row in pattern_rows if row[5] >= 2]
         if unit_rows:
             r.major(p, "units_in_cells",
                     f"Units embedded in values in {len(unit_rows)} column(s)",
                     detail="; ".join(f"{row[0]}: {row[2]!r}" for row in unit_rows[:3]),
                     fix="Split into numeric value column + separate unit column")
-        else:
+        elif patterns_ok:
             r.ok(p, "no_units_in_cells", "No units embedded in cell values")
 
         # ── Placeholder values ───────────────────────────────────────────
-        ph_list = ", ".join(f"'{v}'" for v in PLACEHOLDER_VALUES)
-        try:
-            ph_rows = self._con.execute(f"""
-                SELECT col, COUNT(*) AS n, list_distinct(list(lower(trim(val)))) AS found_vals
-                FROM (UNPIVOT (
-                    SELECT * FROM {self._rcsv(path, 'all_varchar=true')} LIMIT {sample}
-                ) ON COLUMNS(*) INTO NAME col VALUE val)
-                WHERE lower(trim(val)) IN ({ph_list})
-                GROUP BY col HAVING COUNT(*) > 0
-                ORDER BY n DESC LIMIT 10
-            """).fetchall()
-        except Exception:
-            ph_rows = []
+        ph_rows = sorted(((row[0], row[7], row[8]) for row in pattern_rows if row[7] > 0),
+                         key=lambda row: -row[1])[:10]
         if ph_rows:
             all_found = sorted({v for row in ph_rows for v in (row[2] or [])})
             found_str = ", ".join(all_found) if all_found else "…"
@@ -577,88 +976,36 @@ class CsvValidator:
                     f"Placeholder values ({found_str}) in {len(ph_rows)} column(s)",
                     detail=", ".join(f"{row[0]}({row[1]})" for row in ph_rows[:5]),
                     fix="Replace with proper NULL/empty; document missing-data policy")
-        else:
+        elif patterns_ok:
             r.ok(p, "no_placeholder_values", "No placeholder values detected")
 
         # ── VARCHAR columns that look numeric (thousands separator) ───────
-        varchar_typed = {c["name"] for c in self._duckdb_columns if c["type"] in ("VARCHAR", "TEXT")}
-        if varchar_typed:
-            col_filter = " OR ".join(f'col = {c!r}' for c in varchar_typed)
-            try:
-                num_rows = self._con.execute(f"""
-                    SELECT col, COUNT(*) AS hits
-                    FROM (UNPIVOT (
-                        SELECT * FROM {self._rcsv(path, 'all_varchar=true')} LIMIT 200
-                    ) ON COLUMNS(*) INTO NAME col VALUE val)
-                    WHERE ({col_filter})
-                      AND regexp_matches(val, '^\\d{{1,3}}([.,]\\d{{3}})+$')
-                    GROUP BY col HAVING COUNT(*) >= 5
-                """).fetchall()
-            except Exception:
-                num_rows = []
-            if num_rows:
-                r.major(p, "numeric_as_varchar",
-                        f"{len(num_rows)} column(s) are VARCHAR but contain numbers with thousands separator",
-                        detail=", ".join(row[0] for row in num_rows[:5]),
-                        fix="Remove thousands separator then cast to DOUBLE/BIGINT")
+        num_rows = [row for row in pattern_rows if row[0] in varchar_typed and row[9] >= 5]
+        if num_rows:
+            r.major(p, "numeric_as_varchar",
+                    f"{len(num_rows)} column(s) are VARCHAR but contain numbers with thousands separator",
+                    detail=", ".join(row[0] for row in num_rows[:5]),
+                    fix="Remove thousands separator then cast to DOUBLE/BIGINT")
 
         # ── Trailing whitespace in category values ────────────────────────
-        varchar_cats = [c["name"] for c in self._duckdb_columns if c["type"] in ("VARCHAR", "TEXT")]
-        ws_cols: list[str] = []
-        for col in varchar_cats[:20]:
-            try:
-                hit = self._con.execute(f"""
-                    SELECT COUNT(*) FROM {self._rcsv(path)}
-                    WHERE "{col}" IS NOT NULL AND "{col}" != trim("{col}")
-                    LIMIT 1
-                """).fetchone()
-                if hit and hit[0] > 0:
-                    ws_cols.append(col)
-            except Exception:
-                continue
+        categories = {col: (ws, vals) for col, ws, vals in results.get("categories") or ()}
+        ws_cols = [col for col in varchar_cats[:20] if col in categories and categories[col][0]]
         if ws_cols:
             r.minor(p, "trailing_whitespace_values",
                     f"{len(ws_cols)} column(s) with leading/trailing whitespace in values",
                     detail=", ".join(ws_cols[:5]),
                     fix="trim() all string columns before publishing: UPDATE … SET col = TRIM(col)")
-        else:
+        elif categories_ok:
             r.ok(p, "no_trailing_whitespace", "No leading/trailing whitespace in category values")
 
         # ── Statistical outliers (IQR method) ───────────────────────────
-        numeric_types = {"BIGINT", "INTEGER", "SMALLINT", "TINYINT", "HUGEINT",
-                         "DOUBLE", "FLOAT", "REAL", "DECIMAL", "NUMERIC"}
-        num_cols = [
-            c["name"] for c in self._duckdb_columns
-            if any(c["type"].upper().startswith(t) for t in numeric_types)
-        ]
         outlier_cols: list[str] = []
+        outliers_ok = True
         for col in num_cols[:10]:
-            try:
-                row = self._con.execute(f"""
-                    WITH data AS (
-                        SELECT "{col}"::DOUBLE AS v
-                        FROM {self._rcsv(path)}
-                        WHERE "{col}" IS NOT NULL
-                        LIMIT {sample}
-                    ),
-                    bounds AS (
-                        SELECT
-                            percentile_cont(0.25) WITHIN GROUP (ORDER BY v) AS q1,
-                            percentile_cont(0.75) WITHIN GROUP (ORDER BY v) AS q3
-                        FROM data
-                    )
-                    SELECT
-                        (SELECT COUNT(*) FROM data) AS total,
-                        (SELECT COUNT(*) FROM data, bounds
-                         WHERE (q3 - q1) > 0
-                           AND (v < q1 - 1.5*(q3-q1) OR v > q3 + 1.5*(q3-q1))) AS n_out,
-                        (SELECT MAX(v) FROM data, bounds
-                         WHERE (q3 - q1) > 0
-                           AND v > q3 + 1.5*(q3-q1)) AS high_ex
-                    FROM bounds
-                """).fetchone()
-            except Exception:
-                continue
+            if results[("outlier", col)] is None:
+                outliers_ok = False
+                failed.append(f"outliers ({col})")
+            row = (results[("outlier", col)] or [None])[0]
             if row and row[0] and row[0] >= 100 and row[1] and row[1] > 0:
                 ex = f" (e.g. {row[2]})" if row[2] is not None else ""
                 outlier_cols.append(f"{col}: {row[1]}/{row[0]} values{ex}")
@@ -666,40 +1013,35 @@ class CsvValidator:
             r.minor(p, "outlier_values",
                     f"{len(outlier_cols)} numeric column(s) with statistical outliers (IQR method)",
                     detail="; ".join(outlier_cols[:3]))
-        else:
+        elif outliers_ok:
             r.ok(p, "no_outlier_values", "No statistical outliers detected in numeric columns")
 
         # ── Fuzzy near-duplicate category values ─────────────────────────
         fuzzy_issues: list[tuple[str, list]] = []
         for col in varchar_cats[:20]:
             try:
-                vals = self._con.execute(f"""
-                    SELECT trim("{col}"::VARCHAR) AS v
-                    FROM {self._rcsv(path)}
-                    WHERE "{col}" IS NOT NULL AND length(trim("{col}")) > 3
-                    GROUP BY 1 HAVING COUNT(*) >= 2
-                    ORDER BY COUNT(*) DESC LIMIT 80
-                """).fetchall()
-                val_list = [row[0] for row in vals if row[0]]
+                val_list = [v for v in (categories.get(col, (False, None))[1] or ()) if v]
                 if len(val_list) < 2 or len(val_list) > 80:
                     continue
                 if val_list and ISO_DATETIME_PAT.match(val_list[0]):
                     continue  # skip datetime-like columns
                 if len(val_list) / max(self._row_count, 1) > 0.5:
                     continue  # cardinality too high — not categorical
-                self._con.execute("DROP TABLE IF EXISTS __odq_cat")
-                self._con.execute("CREATE TEMP TABLE __odq_cat (v VARCHAR)")
-                self._con.executemany("INSERT INTO __odq_cat VALUES (?)", [(v,) for v in val_list])
+                # the values go in as one list parameter, unnested in the query
                 pairs = self._con.execute("""
+                    WITH cat AS (
+                        SELECT v, length(v) AS n FROM (SELECT unnest(?::VARCHAR[]) AS v) WHERE length(v) > 5
+                    )
                     SELECT a.v, b.v, jaro_winkler_similarity(a.v, b.v) AS sim
-                    FROM __odq_cat a, __odq_cat b
-                    WHERE a.v < b.v
-                      AND length(a.v) > 5 AND length(b.v) > 5
-                      AND jaro_winkler_similarity(a.v, b.v) > 0.95
+                    FROM cat a JOIN cat b
+                      -- blocking: the edit-distance test below needs the lengths to differ
+                      -- by less than 10% (an edit changes the length by at most one), so
+                      -- pairs outside that band are skipped before any similarity is computed
+                      ON a.v < b.v AND abs(a.n - b.n) < 0.10 * GREATEST(a.n, b.n)
+                    WHERE jaro_winkler_similarity(a.v, b.v) > 0.95
                       AND levenshtein(a.v, b.v)::FLOAT / GREATEST(length(a.v), length(b.v)) < 0.10
-                    ORDER BY sim DESC LIMIT 5
-                """).fetchall()
-                self._con.execute("DROP TABLE IF EXISTS __odq_cat")
+                    ORDER BY sim DESC, a.v, b.v LIMIT 5
+                """, [val_list]).fetchall()
                 if pairs:
                     fuzzy_issues.append((col, list(pairs)))
             except Exception:
@@ -713,15 +1055,37 @@ class CsvValidator:
                     f"{len(fuzzy_issues)} column(s) with near-duplicate category values (possible typos)",
                     detail="; ".join(detail_parts),
                     fix="Standardise values: use CASE WHEN or regexp_replace to unify spellings")
-        else:
+        elif categories_ok:
             r.ok(p, "no_fuzzy_category_values", "No near-duplicate category values detected")
 
-    def _check_null_rates(self, rows: list, col_idx: dict, phase: str) -> None:
-        if not rows or "null_percentage" not in col_idx:
+        if failed:
+            r.minor(p, "check_failed",
+                    f"{len(failed)} content check(s) could not be run: {', '.join(failed)}")
+
+    def _fetch_parallel(self, queries: dict, max_workers: int = 4) -> dict:
+        """Run independent read-only queries on sibling cursors of the run connection.
+
+        Returns {key: rows}; a failed query maps to None so each check can fall back
+        exactly as it did when run inline.
+        """
+        def fetch(sql: str, args: list) -> list | None:
+            cur = self._con.cursor()
+            try:
+                return cur.execute(sql, args).fetchall()
+            except Exception:
+                return None
+            finally:
+                cur.close()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = {key: ex.submit(fetch, sql, args) for key, (sql, args) in queries.items()}
+            return {key: f.result() for key, f in futures.items()}
+
+    def _check_null_rates(self, names: list[str], non_null: list[int], total: int, phase: str) -> None:
+        if not total:
             return
-        ci_name = col_idx["column_name"]
-        ci_null = col_idx["null_percentage"]
-        high = [(row[ci_name], row[ci_null]) for row in rows if (row[ci_null] or 0) > 5]
+        pcts = [100 * (total - n) / total for n in non_null]
+        high = [(name, pct) for name, pct in zip(names, pcts) if pct > 5]
         if high:
             detail = ", ".join(f"{name}({pct:.1f}%)" for name, pct in high)
             self.report.major(phase, "high_null_rate",
@@ -735,58 +1099,79 @@ class CsvValidator:
         r, p = self.report, self.P4
 
         # Use raw headers for name detection
-        all_names = self._raw_headers or [c["name"] for c in self._duckdb_columns]
-        code_cols = [n for n in all_names if CODE_COL_PAT.search(n)]
+        all_names = self._raw_headers or self._duck_names
+        code_cols = [n for n in all_names if any(k in n.lower() for k in CODE_COL_KEYS)]
 
         if not code_cols:
             r.ok(p, "no_code_columns", "No administrative code columns detected")
             return
 
-        # Load only those columns (use DuckDB names for the query, raw names for display)
-        # Map raw→duckdb names via position
-        raw_to_duck = {}
-        duck_names = [c["name"] for c in self._duckdb_columns]
-        for i, rn in enumerate(self._raw_headers):
-            if i < len(duck_names):
-                raw_to_duck[rn] = duck_names[i]
-
-        issues: list[str] = []
-        for raw_col in code_cols[:10]:
-            duck_col = raw_to_duck.get(raw_col, raw_col)
-            try:
-                values = [
-                    str(row[0])
-                    for row in self._con.execute(
-                        f"SELECT \"{duck_col}\"::VARCHAR FROM {self._rcsv(self.path, 'all_varchar=true')} "
-                        f"WHERE \"{duck_col}\" IS NOT NULL LIMIT 5000"
-                    ).fetchall()
-                    if row[0] is not None
-                ]
-            except Exception:
-                continue
+        # Use DuckDB names for the query, raw names for display. Only columns with a
+        # format check below are tested.
+        duck_names = set(self._duck_names)
+        targets = [(raw_col, self._raw_to_duck.get(raw_col, raw_col)) for raw_col in code_cols[:10]]
+        targets = [
+            (raw_col, duck_col) for raw_col, duck_col in targets
+            if duck_col in duck_names and _has_code_format_check(raw_col.lower())
+        ]
 
+        # (target index, check, pattern, flag values that do NOT match) for each test
+        tests: list[tuple[int, str, re.Pattern, bool]] = []
+        for i, (raw_col, _) in enumerate(targets):
             col_lower = raw_col.lower()
-
-            # NUTS check
             if "nuts" in col_lower:
-                bad = [v for v in values if not re.match(r"^[A-Z]{2}[0-9A-Z]{1,3}$", v)]
-                if bad:
-                    issues.append(f"{raw_col}: {len(bad)} values don't match NUTS (e.g. {bad[0]!r})")
-
+                tests.append((i, "nuts", NUTS_PAT, True))
             # ISTAT municipality (IT): must be 6 digits
-            if re.search(r"(istat|comune|municipal)", col_lower):
-                short = [v for v in values if re.match(r"^\d{1,5}$", v)]
-                bad = [v for v in values if not re.match(r"^\d{6}$", v)]
-                if short:
-                    issues.append(f"{raw_col}: {len(short)} values look like ISTAT missing leading zeros (e.g. {short[0]!r})")
-                elif bad:
-                    issues.append(f"{raw_col}: {len(bad)} values not 6-digit ISTAT (e.g. {bad[0]!r})")
-
+            if any(k in col_lower for k in ISTAT_COL_KEYS):
+                tests.append((i, "istat_short", ISTAT_SHORT_PAT, False))
+                tests.append((i, "istat_bad", ISTAT_FULL_PAT, True))
             # ISO 3166-1 alpha-2 country
-            if re.search(r"(country_code|iso_country|nation)", col_lower):
-                bad = [v for v in values if not re.match(r"^[A-Z]{2}$", v)]
-                if bad:
-                    issues.append(f"{raw_col}: {len(bad)} values not 2-letter ISO country code (e.g. {bad[0]!r})")
+            if any(k in col_lower for k in COUNTRY_COL_KEYS):
+                tests.append((i, "iso_country", ISO_COUNTRY_PAT, True))
+
+        # One query over the first 5000 non-null values of every code column within the
+        # __odq_raw rows (the first max(sample_rows, 5000) rows of the file): DuckDB
+        # filters them with its own regex engine and only (count, first hit) per test
+        # comes back, instead of the values themselves.
+        counts: dict[tuple[int, str], tuple[int, str | None]] = {}
+        if tests:
+            lists = ", ".join(
+                f'(list("{q}" ORDER BY __odq_rn) FILTER (WHERE "{q}" IS NOT NULL))[1:5000] AS c{i}'
+                for i, q in enumerate(duck_col.replace('"', '""') for _, duck_col in targets)
+            )
+            hits = ", ".join(
+                f"list_filter(c{i}, v -> {'NOT ' if neg else ''}regexp_matches(v, ?)) AS h{n}"
+                for n, (i, _, _, neg) in enumerate(tests)
+            )
+            out = ", ".join(f"len(h{n}), h{n}[1]" for n in range(len(tests)))
+            try:
+                row = self._con.execute(f"""
+                    WITH s AS (SELECT {lists} FROM __odq_raw),
+                    h AS (SELECT {hits} FROM s)
+                    SELECT {out} FROM h
+                """, [pat.pattern for _, _, pat, _ in tests]).fetchone()
+            except Exception:
+                row = None
+            if row:
+                for n, (i, check, _, _) in enumerate(tests):
+                    counts[i, check] = (row[2 * n] or 0, row[2 * n + 1])
+
+        issues: list[str] = []
+        for i, (raw_col, _) in enumerate(targets):
+            n_bad, ex = counts.get((i, "nuts"), (0, None))
+            if n_bad:
+                issues.append(f"{raw_col}: {n_bad} values don't match NUTS (e.g. {ex!r})")
+
+            n_short, ex_short = counts.get((i, "istat_short"), (0, None))
+            n_bad, ex = counts.get((i, "istat_bad"), (0, None))
+            if n_short:
+                issues.append(f"{raw_col}: {n_short} values look like ISTAT missing leading zeros (e.g. {ex_short!r})")
+            elif n_bad:
+                issues.append(f"{raw_col}: {n_bad} values not 6-digit ISTAT (e.g. {ex!r})")
+
+            n_bad, ex = counts.get((i, "iso_country"), (0, None))
+            if n_bad:
+                issues.append(f"{raw_col}: {n_bad} values not 2-letter ISO country code (e.g. {ex!r})")
 
         if issues:
             r.major(p, "invalid_reference_codes",
@@ -800,35 +1185,8 @@ class CsvValidator:
 
     def _compute_scores(self) -> None:
         r = self.report
-        codes = {f.code for f in r.findings if f.severity != Severity.OK}
-
-        # File format (15 pts)
-        fmt = 15
-        if "encoding_not_utf8" in codes: fmt -= 10
-        if "bom_present"        in codes: fmt -= 5
-        if "no_header"          in codes: fmt -= 3
-        r.dimensions.append(ScoreDimension("File format compliance", 15, max(0, fmt)))
-
-        # Data structure (20 pts)
-        struct = 20
-        if "wide_format_years"   in codes: struct -= 5
-        if "wide_format_months"  in codes: struct -= 5
-        if "duplicate_columns"   in codes: struct -= 5
-        if "aggregate_rows"      in codes: struct -= 5
-        if "bad_column_names"    in codes: struct -= 3
-        if "footnote_markers"    in codes: struct -= 2
-        r.dimensions.append(ScoreDimension("Data structure quality", 20, max(0, struct)))
-
-        # Data content (25 pts)
-        content = 25
-        if "comma_decimal"         in codes: content -= 5
-        if "non_iso_date"          in codes: content -= 5
-        if "high_null_rate"        in codes: content -= 5
-        if "units_in_cells"        in codes: content -= 3
-        if "placeholder_values"    in codes: content -= 3
-        if "invalid_reference_codes" in codes: content -= 4
-        if "numeric_as_varchar"      in codes: content -= 2
-        if "fuzzy_category_values"   in codes: content -= 2
-        if "duplicate_rows"          in codes: content -= 3
-        if "outlier_values"          in codes: content -= 2
-        r.dimensions.append(ScoreDimension("Data content quality", 25, max(0, content)))
+        codes = {f.code for f in r.findings if f.severity is not Severity.OK}
+
+        for name, (max_pts, penalties) in self._SCORE_PENALTIES.items():
+            pts = max_pts - sum(penalties.get(code, 0) for code in codes)
+            r.dimensions.append(ScoreDimension(name, max_pts, max(0, pts)))
@@ -7,13 +7,23 @@ Works on the Python dict returned by CKAN package_show.
 
 from __future__ import annotations
 
+import codecs
+import importlib.util
 import json
 import re
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, Collection
+from urllib.parse import urlsplit
 
 import httpx
+from charset_normalizer import from_bytes
+
+try:  # optional: linear-time RE2 engine for URL and date patterns
+    import re2 as meta_re
+except ImportError:
+    meta_re = re
 
 from .models import QualityReport, ScoreDimension
 
@@ -23,14 +33,25 @@ FIELD_ALIASES: dict[str, dict[str, str]] = json.loads(_ALIASES_FILE.read_text())
 PHASE5 = "phase5_metadata"
 PHASE6 = "phase6_consistency"
 
-ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-ISO_DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
-NON_ISO_DATE_RE = re.compile(r"^\d{1,2}[-/\.]\d{1,2}[-/\.]\d{4}$")
+# [0-9], not \d: RE2's \d is ASCII-only, re's is Unicode; this way both engines agree
+ISO_DATE_RE = meta_re.compile(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$")
+# date field classification: lastgroup is "noniso", "iso" (date or datetime) or no match
+DATE_KIND_RE = meta_re.compile(
+    r"(?P<noniso>[0-9]{1,2}[-/\.][0-9]{1,2}[-/\.][0-9]{4}$)"
+    r"|(?P<iso>[0-9]{4}-[0-9]{2}-[0-9]{2}(?:$|[T ][0-9]{2}:[0-9]{2}))"
+)
+
+# declared update frequency → days since `modified` before the data counts as stale
+FREQ_MAX_AGE_DAYS = {
+    "DAILY": 7, "WEEKLY": 30, "MONTHLY": 90,
+    "QUARTERLY": 180, "ANNUAL": 730, "BIENNIAL": 1460,
+}
+
+IT_IDENTIFIER_RE = re.compile(r"[a-z]_[a-z0-9]+:")   # istat_code:slug
 
-UNSTABLE_URL_RE = re.compile(
-    r"bit\.ly|tinyurl|goo\.gl|t\.co|google\.com/spreadsheets"
+UNSTABLE_URL_RE = meta_re.compile(
+    r"(?i)bit\.ly|tinyurl|goo\.gl|t\.co|google\.com/spreadsheets"
     r"|dropbox\.com|drive\.google|onedrive\.live",
-    re.IGNORECASE,
 )
 
 # National profile detection: portal URL → profile key
@@ -48,6 +69,13 @@ PORTAL_PROFILES: list[tuple[re.Pattern, str]] = [
     (re.compile(r"data\.public\.lu",        re.I), "DCAT-AP_LU"),
 ]
 
+# PORTAL_PROFILES as one alternation: group i+1 is entry i, so one search classifies a URL
+_PORTAL_RE = meta_re.compile(
+    "(?i)" + "|".join(f"({pattern.pattern})" for pattern, _ in PORTAL_PROFILES)
+)
+if _PORTAL_RE.groups != len(PORTAL_PROFILES):   # lastindex dispatch needs one group per entry
+    raise ValueError("PORTAL_PROFILES patterns must not contain capturing groups; use (?:...)")
+
 # Profile-specific mandatory fields (beyond DCAT-AP baseline)
 # key: extras key name in CKAN JSON, label: human readable
 PROFILE_EXTRA_FIELDS: dict[str, list[tuple[str, str, str]]] = {
@@ -72,18 +100,52 @@ PROFILE_EXTRA_FIELDS: dict[str, list[tuple[str, str, str]]] = {
     ],
 }
 
+# PROFILE_EXTRA_FIELDS expanded once: (extras_key, finding code, message, mandatory)
+_PROFILE_FIELD_CHECKS: dict[str, list[tuple[str, str, str, bool]]] = {
+    profile: [
+        (key, f"missing_{key}",
+         f"[{profile}] {'Mandatory' if card == 'mandatory' else 'Recommended'} field missing: {label}",
+         card == "mandatory")
+        for key, label, card in fields
+    ]
+    for profile, fields in PROFILE_EXTRA_FIELDS.items()
+}
+
 
-def _extras_value(metadata: dict, key: str) -> str:
+def pooled_client(timeout: float, concurrency: int = 8) -> httpx.Client:
+    """httpx client keeping one pooled connection per concurrent probe.
+
+    With the optional ``h2`` package, requests to the same host are multiplexed
+    over a single HTTP/2 connection.
+    """
+    n = max(1, concurrency)
+    return httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=n, max_keepalive_connections=n),
+        follow_redirects=True,
+        timeout=timeout,
+    )
+
+
+def _extras_map(metadata: dict) -> dict[str, Any]:
+    """Index the CKAN extras list by key (first occurrence wins, as in a linear scan)."""
+    items = metadata.get("extras") or []
+    return {item.get("key"): item.get("value") for item in reversed(items)}
+
+
+def _extras_value(metadata: dict, key: str, extras: dict[str, Any] | None = None) -> str:
     """Get value from CKAN extras list or top-level package field by key.
 
     Some harvesters (e.g. dati.gov.it harvesting from regional portals) promote
     extras such as holder_name and identifier to top-level package fields instead
     of storing them in the extras list. We check extras first, then fall back to
-    the top-level field.
+    the top-level field. Pass ``extras`` (from ``_extras_map``) when looking up
+    many keys on the same package.
     """
-    for item in metadata.get("extras", []):
-        if item.get("key") == key:
-            return (item.get("value") or "").strip()
+    if extras is None:
+        extras = _extras_map(metadata)
+    if key in extras:
+        return (extras[key] or "").strip()
     # Fallback: top-level package field (harvester-promoted extras)
     val = metadata.get(key, "")
     return (val or "").strip()
@@ -92,14 +154,15 @@ def _extras_value(metadata: dict, key: str) -> str:
 def detect_profile(metadata: dict, portal_url: str = "") -> str:
     """Heuristically detect DCAT-AP national profile."""
     # 1. Portal URL
-    for pattern, profile in PORTAL_PROFILES:
-        if pattern.search(portal_url):
-            return profile
+    m = _PORTAL_RE.search(portal_url)
+    if m:
+        return PORTAL_PROFILES[m.lastindex - 1][1]
     # 2. Italian-specific: identifier follows istat_code:slug pattern
-    identifier = _extras_value(metadata, "identifier")
-    if re.match(r"^[a-z]_[a-z0-9]+:", identifier):
+    extras = _extras_map(metadata)
+    identifier = _extras_value(metadata, "identifier", extras)
+    if identifier[1:2] == "_" and "a" <= identifier[0] <= "z" and IT_IDENTIFIER_RE.match(identifier):
         return "DCAT-AP_IT"
-    if _extras_value(metadata, "holder_name"):
+    if _extras_value(metadata, "holder_name", extras):
         return "DCAT-AP_IT"
     # Fallback
     return "DCAT-AP_2x"
@@ -110,6 +173,7 @@ class MetadataValidator:
 
     def __init__(self, metadata: dict, portal_url: str = "", report: QualityReport | None = None):
         self.meta = metadata
+        self._extras = _extras_map(metadata)
         self.portal_url = portal_url
         self.report = report or QualityReport(source=portal_url or metadata.get("name", "unknown"))
         self.profile = detect_profile(metadata, portal_url)
@@ -147,7 +211,7 @@ class MetadataValidator:
             r.major(p, "missing_description", "Description (dct:description) is missing",
                     fix="Add a description explaining the dataset content, coverage, and purpose")
             score -= 4
-        elif notes.strip() == title.strip():
+        elif notes == title:
             r.major(p, "description_equals_title",
                     "Description is identical to title — not a real description",
                     fix="Write a proper description explaining content, coverage, and purpose")
@@ -188,32 +252,33 @@ class MetadataValidator:
         # dates
         _profile_aliases = FIELD_ALIASES.get(self.profile, {})
         for date_key in ("issued", "modified"):
-            val = (self.meta.get(date_key) or _extras_value(self.meta, date_key)).strip()
+            val = (self.meta.get(date_key) or _extras_value(self.meta, date_key, self._extras)).strip()
             if not val:
                 alias = _profile_aliases.get(date_key)
                 if alias:
-                    val = (self.meta.get(alias) or _extras_value(self.meta, alias)).strip()
+                    val = (self.meta.get(alias) or _extras_value(self.meta, alias, self._extras)).strip()
             if not val:
                 r.major(p, f"missing_{date_key}",
                         f"Date field '{date_key}' (dct:{date_key}) is missing or empty string",
                         fix=f"Set {date_key} to the actual date in ISO 8601 format: YYYY-MM-DD")
                 score -= 2
-            elif NON_ISO_DATE_RE.match(val):
+                continue
+            m = DATE_KIND_RE.match(val)
+            kind = m.lastgroup if m else None
+            if kind == "iso":
+                r.ok(p, f"{date_key}_ok", f"{date_key}: {val}")
+            elif kind == "noniso":
                 r.major(p, f"non_iso_{date_key}",
                         f"Field '{date_key}' is not ISO 8601: {val!r}",
                         fix=f"Convert to YYYY-MM-DD format")
                 score -= 2
-            elif ISO_DATETIME_RE.match(val):
-                r.ok(p, f"{date_key}_ok", f"{date_key}: {val}")
-            elif not ISO_DATE_RE.match(val):
+            else:
                 r.minor(p, f"invalid_{date_key}",
                         f"Field '{date_key}' has unexpected format: {val!r}")
                 score -= 1
-            else:
-                r.ok(p, f"{date_key}_ok", f"{date_key}: {val}")
 
         # update frequency
-        freq = _extras_value(self.meta, "frequency") or _extras_value(self.meta, "accrualPeriodicity")
+        freq = _extras_value(self.meta, "frequency", self._extras) or _extras_value(self.meta, "accrualPeriodicity", self._extras)
         if not freq:
             r.minor(p, "missing_frequency",
                     "Update frequency (dct:accrualPeriodicity) is missing",
@@ -222,22 +287,22 @@ class MetadataValidator:
             r.ok(p, "frequency_ok", f"Update frequency: {freq}")
 
         # temporal coverage
-        tc = _extras_value(self.meta, "temporal_coverage")
+        tc = _extras_value(self.meta, "temporal_coverage", self._extras)
         if not tc:
             r.minor(p, "missing_temporal_coverage",
                     "Temporal coverage (dct:temporal) is missing",
                     fix="Specify the time range covered by the dataset")
 
         # spatial coverage
-        spatial = _extras_value(self.meta, "geographical_geonames_url") or \
-                  _extras_value(self.meta, "spatial")
+        spatial = _extras_value(self.meta, "geographical_geonames_url", self._extras) or \
+                  _extras_value(self.meta, "spatial", self._extras)
         if not spatial:
             r.minor(p, "missing_spatial",
                     "Spatial coverage (dct:spatial) is missing",
                     fix="Add a GeoNames URI or WKT bounding box")
 
         # language
-        lang = _extras_value(self.meta, "language")
+        lang = _extras_value(self.meta, "language", self._extras)
         if not lang:
             r.minor(p, "missing_language", "Language (dct:language) is missing",
                     fix="Add language code, e.g. 'ITA', 'ENG'")
@@ -245,31 +310,27 @@ class MetadataValidator:
             r.ok(p, "language_ok", f"Language: {lang}")
 
         # identifier
-        identifier = _extras_value(self.meta, "identifier")
+        identifier = _extras_value(self.meta, "identifier", self._extras)
         if not identifier:
             r.minor(p, "missing_identifier", "Identifier (dct:identifier) is missing")
         else:
             r.ok(p, "identifier_ok", f"Identifier: {identifier!r}")
 
         # profile-specific extra fields
-        extra_fields = PROFILE_EXTRA_FIELDS.get(self.profile, [])
-        for extras_key, label, cardinality in extra_fields:
-            val = _extras_value(self.meta, extras_key)
-            if not val:
-                if cardinality == "mandatory":
-                    r.major(p, f"missing_{extras_key}",
-                            f"[{self.profile}] Mandatory field missing: {label}",
-                            fix=f"Add '{extras_key}' field to CKAN metadata")
-                    score -= 3
-                else:
-                    r.minor(p, f"missing_{extras_key}",
-                            f"[{self.profile}] Recommended field missing: {label}")
+        for extras_key, code, message, mandatory in _PROFILE_FIELD_CHECKS.get(self.profile, ()):
+            if _extras_value(self.meta, extras_key, self._extras):
+                continue
+            if mandatory:
+                r.major(p, code, message, fix=f"Add '{extras_key}' field to CKAN metadata")
+                score -= 3
+            else:
+                r.minor(p, code, message)
 
         # ── per-resource checks ───────────────────────────────────────────
         resources = self.meta.get("resources") or []
         for res in resources:
             res_name = res.get("name") or res.get("id") or "?"
-            prefix = f"resource_{res.get('id', 'x')[:8]}"
+            prefix = "resource_" + (res.get("id") or "x")[:8]
 
             # format
             fmt = (res.get("format") or res.get("distribution_format") or "").strip()
@@ -328,14 +389,34 @@ class AccessibilityChecker:
     """
     Checks whether all resource URLs are reachable.
     Run this BEFORE downloading files — quick HTTP HEAD checks only.
+
+    Probes run concurrently (up to ``concurrency`` at a time), so total latency is
+    close to the slowest single request rather than the sum of all round trips.
+    Pass ``client`` to reuse an existing connection pool (e.g. the one used to fetch
+    the CKAN metadata).
     """
 
-    def __init__(self, metadata: dict, report: QualityReport, timeout: float = 15.0):
+    def __init__(self, metadata: dict, report: QualityReport, timeout: float = 15.0,
+                 client: httpx.Client | None = None, concurrency: int = 8):
         self.meta = metadata
         self.report = report
         self.timeout = timeout
-
-    def run(self) -> None:
+        self.client = client
+        self.concurrency = max(1, concurrency)
+
+    def _probe(self, client: httpx.Client, url: str) -> httpx.Response | Exception:
+        """HEAD the URL (falling back to GET); return the response or the raised exception."""
+        try:
+            resp = client.head(url, timeout=self.timeout)
+            # Some servers return 405 for HEAD but 200 for GET — try GET on 4xx/5xx
+            if resp.status_code >= 400:
+                resp = client.get(url, timeout=self.timeout)
+            return resp
+        except Exception as e:
+            return e
+
+    def run(self, skip_urls: Collection[str] = ()) -> None:
+        """``skip_urls`` were already fetched successfully (e.g. downloaded) and count as HTTP 200."""
         resources = self.meta.get("resources") or []
         if not resources:
             self.report.major(PHASE5, "no_resources",
@@ -347,46 +428,56 @@ class AccessibilityChecker:
         score = 20
         accessible = 0
 
-        with httpx.Client(follow_redirects=True, timeout=self.timeout) as client:
-            for res in resources:
-                url = (res.get("url") or "").strip()
-                name = res.get("name") or url[:60]
-                prefix = f"access_{res.get('id', 'x')[:8]}"
-
-                if not url:
-                    continue
-
-                if UNSTABLE_URL_RE.search(url):
-                    # already flagged in metadata phase — just count as accessible if reachable
-                    pass
-
-                try:
-                    resp = client.head(url, timeout=self.timeout)
-                    # Some servers return 405 for HEAD but 200 for GET — try GET on 4xx/5xx
-                    if resp.status_code >= 400:
-                        resp = client.get(url, timeout=self.timeout)
-
-                    if resp.status_code == 200:
-                        accessible += 1
-                        self.report.ok(PHASE5, f"{prefix}_accessible",
-                                       f"Resource accessible: {name!r} (HTTP 200)")
-                    else:
-                        score -= 5
-                        self.report.blocker(PHASE5, f"{prefix}_not_accessible",
-                                            f"Resource not accessible: {name!r} (HTTP {resp.status_code})",
-                                            detail=url,
-                                            fix=f"Fix the URL or restore the file. HTTP {resp.status_code}.")
-                except httpx.TimeoutException:
-                    score -= 5
-                    self.report.major(PHASE5, f"{prefix}_timeout",
-                                      f"Resource timed out after {self.timeout}s: {name!r}",
-                                      detail=url,
-                                      fix="Check server availability; increase timeout or fix hosting")
-                except Exception as e:
-                    score -= 3
-                    self.report.major(PHASE5, f"{prefix}_error",
-                                      f"Resource check failed: {name!r}: {e}",
-                                      detail=url)
+        targets = [(res, (res.get("url") or "").strip()) for res in resources]
+        targets = [(res, url) for res, url in targets if url]
+
+        outcomes: dict[str, httpx.Response | Exception] = {
+            url: httpx.Response(200) for url in skip_urls
+        }
+        to_probe = list(dict.fromkeys(url for _, url in targets if url not in outcomes))
+        # grouped by host so consecutive probes find a warm pooled connection
+        to_probe.sort(key=lambda u: urlsplit(u).netloc.lower())
+        if to_probe:
+            client = self.client or pooled_client(self.timeout, self.concurrency)
+            try:
+                workers = min(self.concurrency, len(to_probe))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    outcomes.update(zip(to_probe, pool.map(lambda u: self._probe(client, u), to_probe)))
+            finally:
+                if self.client is None:
+                    client.close()
+
+        # Record results in resource order so the report is deterministic
+        for res, url in targets:
+            outcome = outcomes[url]
+            name = res.get("name") or url[:60]
+            prefix = "access_" + (res.get("id") or "x")[:8]
+
+            if UNSTABLE_URL_RE.search(url):
+                # already flagged in metadata phase — just count as accessible if reachable
+                pass
+
+            if isinstance(outcome, httpx.TimeoutException):
+                score -= 5
+                self.report.major(PHASE5, f"{prefix}_timeout",
+                                  f"Resource timed out after {self.timeout}s: {name!r}",
+                                  detail=url,
+                                  fix="Check server availability; increase timeout or fix hosting")
+            elif isinstance(outcome, Exception):
+                score -= 3
+                self.report.major(PHASE5, f"{prefix}_error",
+                                  f"Resource check failed: {name!r}: {outcome}",
+                                  detail=url)
+            elif outcome.status_code == 200:
+                accessible += 1
+                self.report.ok(PHASE5, f"{prefix}_accessible",
+                               f"Resource accessible: {name!r} (HTTP 200)")
+            else:
+                score -= 5
+                self.report.blocker(PHASE5, f"{prefix}_not_accessible",
+                                    f"Resource not accessible: {name!r} (HTTP {outcome.status_code})",
+                                    detail=url,
+                                    fix=f"Fix the URL or restore the file. HTTP {outcome.status_code}.")
 
         total = len([r for r in resources if r.get("url")])
         self.report.ok(PHASE5, "accessibility_summary",
@@ -397,27 +488,44 @@ class AccessibilityChecker:
         self.report.dimensions.append(ScoreDimension("Accessibility", 20, max(0, score)))
 
 
+_BOM_ENCODINGS = ((b"\xef\xbb\xbf", "utf_8"), (b"\xff\xfe", "utf_16"), (b"\xfe\xff", "utf_16"))
+
+
+def _sniff_encoding(raw: bytes) -> str:
+    """Encoding name of a leading byte sample, in charset-normalizer's spelling."""
+    for bom, name in _BOM_ENCODINGS:
+        if raw.startswith(bom):
+            return name
+    if raw.isascii():
+        return "ascii"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(raw, final=False)
+        return "utf_8"
+    except UnicodeDecodeError:
+        pass
+    best = from_bytes(raw).best()
+    return best.encoding if best else ""
+
+
 class ConsistencyChecker:
     """Phase 6: cross-validation between metadata and actual file content."""
 
     def __init__(self, metadata: dict, csv_path, report: QualityReport):
         self.meta = metadata
+        self._extras = _extras_map(metadata)
         self.csv_path = csv_path
         self.report = report
 
     def run(self) -> None:
-        from charset_normalizer import from_bytes
         r = self.report
         p = PHASE6
 
         # Declared encoding vs actual
-        declared_enc = (_extras_value(self.meta, "encoding") or "").lower().replace("-", "")
+        declared_enc = (_extras_value(self.meta, "encoding", self._extras) or "").lower().replace("-", "")
         if declared_enc and self.csv_path:
-            from pathlib import Path
             with open(self.csv_path, "rb") as f:
                 raw = f.read(65536)
-            best = from_bytes(raw).best()
-            actual = (best.encoding if best else "").lower().replace("-", "")
+            actual = _sniff_encoding(raw).lower().replace("-", "")
             if declared_enc and actual and declared_enc not in actual and actual not in declared_enc:
                 r.major(p, "encoding_mismatch",
                         f"Declared encoding ({declared_enc!r}) ≠ actual ({actual!r})",
@@ -426,18 +534,12 @@ class ConsistencyChecker:
                 r.ok(p, "encoding_consistent", f"Encoding consistent: {actual!r}")
 
         # Temporal coverage vs update frequency consistency (heuristic)
-        freq = _extras_value(self.meta, "frequency")
-        modified = _extras_value(self.meta, "modified")
+        freq = _extras_value(self.meta, "frequency", self._extras)
+        modified = _extras_value(self.meta, "modified", self._extras)
         if freq and modified and ISO_DATE_RE.match(modified):
             try:
-                mod_date = datetime.strptime(modified, "%Y-%m-%d").date()
-                today = date.today()
-                delta_days = (today - mod_date).days
-                freq_thresholds = {
-                    "DAILY": 7, "WEEKLY": 30, "MONTHLY": 90,
-                    "QUARTERLY": 180, "ANNUAL": 730, "BIENNIAL": 1460,
-                }
-                threshold = freq_thresholds.get(freq.upper())
+                delta_days = (date.today() - date.fromisoformat(modified)).days
+                threshold = FREQ_MAX_AGE_DAYS.get(freq.upper())
                 if threshold and delta_days > threshold:
                     r.minor(p, "stale_data",
                             f"Data may be stale: declared frequency {freq!r}, "
@@ -5,10 +5,16 @@ Data models shared across all validators.
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+try:  # optional accelerator: pip install "open-data-quality[fast]"
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Severity(str, Enum):
     BLOCKER = "blocker"
@@ -25,7 +31,7 @@ SEVERITY_EMOJI = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     severity: Severity
     phase: str
@@ -45,7 +51,7 @@ class Finding:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreDimension:
     name: str
     max_score: int
@@ -57,7 +63,7 @@ class ScoreDimension:
         return self.max_score - self.score
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityReport:
     source: str                      # filename or CKAN URL
     profile: str = "unknown"         # DCAT-AP profile detected
@@ -96,7 +102,7 @@ class QualityReport:
 
     @property
     def has_blockers(self) -> bool:
-        return len(self.blockers) > 0
+        return any(f.severity == Severity.BLOCKER for f in self.findings)
 
     # ── helpers ───────────────────────────────────────────────────────────
 
@@ -104,16 +110,16 @@ class QualityReport:
         self.findings.append(finding)
 
     def ok(self, phase: str, code: str, message: str) -> None:
-        self.findings.append(Finding(Severity.OK, phase, code, message))
+        self.add(Finding(Severity.OK, sys.intern(phase), sys.intern(code), message))
 
     def blocker(self, phase: str, code: str, message: str, detail: str = "", fix: str = "") -> None:
-        self.findings.append(Finding(Severity.BLOCKER, phase, code, message, detail, fix))
+        self.add(Finding(Severity.BLOCKER, sys.intern(phase), sys.intern(code), message, detail, fix))
 
     def major(self, phase: str, code: str, message: str, detail: str = "", fix: str = "") -> None:
-        self.findings.append(Finding(Severity.MAJOR, phase, code, message, detail, fix))
+        self.add(Finding(Severity.MAJOR, sys.intern(phase), sys.intern(code), message, detail, fix))
 
     def minor(self, phase: str, code: str, message: str, detail: str = "", fix: str = "") -> None:
-        self.findings.append(Finding(Severity.MINOR, phase, code, message, detail, fix))
+        self.add(Finding(Severity.MINOR, sys.intern(phase), sys.intern(code), message, detail, fix))
 
     def suppress(self, code: str) -> None:
         """Remove all findings with the given code (used to cancel false positives)."""
@@ -139,4 +145,12 @@ class QualityReport:
         }
 
     def to_json(self, indent: int = 2) -> str:
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    def to_json_bytes(self) -> bytes:
+        """UTF-8 encoded ``to_json()``; with orjson there is no intermediate str."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        return self.to_json().encode("utf-8")
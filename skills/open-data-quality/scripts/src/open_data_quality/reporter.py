@@ -4,15 +4,19 @@ Render a QualityReport to the terminal (Rich) or as plain Markdown.
 
 from __future__ import annotations
 
+import os
+import stat
 from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from .models import Finding, QualityReport, Severity
 
-from .models import QualityReport, Severity
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
+
+# rich is imported inside render_terminal, so that Markdown/JSON-only callers
+# do not pay its import cost.
 
 _SEV_STYLE = {
     Severity.BLOCKER: "bold red",
@@ -29,78 +33,122 @@ _SEV_LABEL = {
 }
 
 
-def render_terminal(report: QualityReport, console: Console | None = None, show_ok: bool = False) -> None:
-    """Print a rich-formatted report to the terminal."""
-    con = console or Console()
+def _partition(report: QualityReport) -> dict[Severity, list[Finding]]:
+    """Findings by severity, in emission order, from one pass over report.findings."""
+    by_sev: dict[Severity, list[Finding]] = {s: [] for s in Severity}
+    for f in report.findings:
+        by_sev[f.severity].append(f)
+    return by_sev
+
+
+def _pct_colour(pct: int) -> str:
+    """Header colour for an overall 0–100 score."""
+    return "red" if pct < 50 else ("yellow" if pct < 75 else "green")
+
+
+def _score_colour(score: int, max_score: int) -> str:
+    """Score-table colour: red below half marks, yellow below full marks."""
+    return "red" if score < max_score * 0.5 else ("yellow" if score < max_score else "green")
+
+
+# Markdown issue sections, in display order: (severity, heading prefix)
+_MD_SECTIONS = tuple(
+    (sev, f"## {emoji} {sev.value.title()} issues")
+    for sev, emoji in ((Severity.BLOCKER, "⛔"), (Severity.MAJOR, "⚠️"), (Severity.MINOR, "ℹ️"))
+)
+
+
+def render_terminal(report: QualityReport, console: Console | None = None, show_ok: bool = False,
+                    today: str | None = None) -> None:
+    """Print a rich-formatted report to the terminal.
+
+    ``today`` is the ISO validation date shown in the header (default: today).
+    """
+    from rich import box
+    from rich.console import Console, Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    con = console or Console(highlight=False)
+    by_sev = _partition(report)
 
     # ── header ──────────────────────────────────────────────────────────
-    score_colour = "red" if report.score_pct < 50 else ("yellow" if report.score_pct < 75 else "green")
+    score_colour = _pct_colour(report.score_pct)
     header = (
         f"[bold]Open Data Quality Report[/bold]\n"
         f"Source:   {report.source}\n"
         f"Profile:  {report.profile}\n"
-        f"Date:     {date.today().isoformat()}\n"
+        f"Date:     {today or date.today().isoformat()}\n"
         f"Score:    [{score_colour}]{report.score_pct}/100[/{score_colour}] "
         f"({report.total_score}/{report.max_score} pts)"
     )
-    con.print(Panel(header, expand=False, border_style="bold blue"))
+    # Everything is collected into one Group and printed in a single call: Rich's
+    # per-print overhead dominates on reports with hundreds of findings.
+    parts: list[RenderableType] = [Panel(header, expand=False, border_style="bold blue")]
+    # Finding lines are styled Text, not markup: no markup or highlighter pass, and
+    # bracketed text (phase labels, values quoted from the data) prints literally.
+    buf: list[Text] = []
 
     # ── findings grouped by severity ────────────────────────────────────
     for sev in (Severity.BLOCKER, Severity.MAJOR, Severity.MINOR):
-        findings = [f for f in report.findings if f.severity == sev]
+        findings = by_sev[sev]
         if not findings:
             continue
         label = _SEV_LABEL[sev]
         style = _SEV_STYLE[sev]
-        con.print(f"\n[{style}]{label} ({len(findings)})[/{style}]")
+        buf.append(Text.assemble("\n", (f"{label} ({len(findings)})", style)))
+        bullet = ("•", style)
         for f in findings:
-            con.print(f"  [{style}]•[/{style}] [{style}][{f.phase}][/{style}] {f.message}")
+            buf.append(Text.assemble("  ", bullet, " ", (f"[{f.phase}]", style), " ", f.message))
             if f.detail:
-                con.print(f"    [dim]Detail:[/dim] {f.detail}")
+                buf.append(Text.assemble("    ", ("Detail:", "dim"), " ", f.detail))
             if f.fix:
-                con.print(f"    [dim]Fix:[/dim] [italic]{f.fix}[/italic]")
+                buf.append(Text.assemble("    ", ("Fix:", "dim"), " ", (f.fix, "italic")))
 
     # ── OK findings (optional) ──────────────────────────────────────────
     if show_ok:
-        ok_findings = [f for f in report.findings if f.severity == Severity.OK]
+        ok_findings = by_sev[Severity.OK]
         if ok_findings:
-            con.print("\n[green]✅ Passed checks[/green]")
+            buf.append(Text.assemble("\n", ("✅ Passed checks", "green")))
             for f in ok_findings:
-                con.print(f"  [green]•[/green] [{f.phase}] {f.message}")
+                buf.append(Text.assemble("  ", ("•", "green"), f" [{f.phase}] {f.message}"))
+
+    if buf:
+        parts.append(Text("\n").join(buf))
 
     # ── score table ──────────────────────────────────────────────────────
     if report.dimensions:
-        con.print()
+        parts.append("")
         tbl = Table(title="Score breakdown", box=box.SIMPLE_HEAVY, show_header=True)
         tbl.add_column("Dimension", style="bold")
         tbl.add_column("Score", justify="right")
         tbl.add_column("Max",   justify="right")
         tbl.add_column("Notes")
         for dim in report.dimensions:
-            colour = "red" if dim.score < dim.max_score * 0.5 else (
-                "yellow" if dim.score < dim.max_score else "green"
-            )
             tbl.add_row(
                 dim.name,
-                f"[{colour}]{dim.score}[/{colour}]",
+                Text.assemble((str(dim.score), _score_colour(dim.score, dim.max_score))),
                 str(dim.max_score),
-                "; ".join(dim.notes) if dim.notes else "",
+                "; ".join(dim.notes),
             )
-        con.print(tbl)
+        parts.append(tbl)
 
     # ── summary verdict ──────────────────────────────────────────────────
-    if report.has_blockers:
+    if by_sev[Severity.BLOCKER]:
         verdict = "[bold red]⛔ UNUSABLE — blocker issues must be resolved first.[/bold red]"
-    elif report.majors:
-        verdict = f"[bold yellow]⚠️  USABLE WITH CAUTION — {len(report.majors)} major issue(s) to fix.[/bold yellow]"
+    elif by_sev[Severity.MAJOR]:
+        verdict = f"[bold yellow]⚠️  USABLE WITH CAUTION — {len(by_sev[Severity.MAJOR])} major issue(s) to fix.[/bold yellow]"
     else:
         verdict = "[bold green]✅ GOOD — minor or no issues detected.[/bold green]"
-    con.print(f"\n{verdict}\n")
+    parts.append(f"\n{verdict}\n")
+    con.print(Group(*parts))
 
 
-def render_markdown(report: QualityReport, show_ok: bool = False) -> str:
-    """Return the report as a Markdown string (for --output-md or piping)."""
+def render_markdown(report: QualityReport, show_ok: bool = False, today: str | None = None) -> str:
+    """Return the report as a Markdown string (for --output-md or piping); ``today`` as in render_terminal."""
     lines: list[str] = []
+    by_sev = _partition(report)
     score_label = f"{report.score_pct}/100 ({report.total_score}/{report.max_score} pts)"
 
     lines += [
@@ -110,27 +158,27 @@ def render_markdown(report: QualityReport, show_ok: bool = False) -> str:
         f"|---|---|",
         f"| **Source** | {report.source} |",
         f"| **DCAT-AP profile** | {report.profile} |",
-        f"| **Validated** | {date.today().isoformat()} |",
+        f"| **Validated** | {today or date.today().isoformat()} |",
         f"| **Score** | {score_label} |",
         "",
     ]
 
-    for sev, emoji in ((Severity.BLOCKER, "⛔"), (Severity.MAJOR, "⚠️"), (Severity.MINOR, "ℹ️")):
-        findings = [f for f in report.findings if f.severity == sev]
+    for sev, heading in _MD_SECTIONS:
+        findings = by_sev[sev]
         if not findings:
             continue
-        lines.append(f"## {emoji} {sev.value.title()} issues ({len(findings)})")
+        lines.append(f"{heading} ({len(findings)})")
+        lines.append("")
+        lines.append("\n\n".join(
+            f"**[{f.phase}]** {f.message}"
+            + (f"\n- *Detail:* `{f.detail}`" if f.detail else "")
+            + (f"\n- *Fix:* `{f.fix}`" if f.fix else "")
+            for f in findings
+        ))
         lines.append("")
-        for f in findings:
-            lines.append(f"**[{f.phase}]** {f.message}")
-            if f.detail:
-                lines.append(f"- *Detail:* `{f.detail}`")
-            if f.fix:
-                lines.append(f"- *Fix:* `{f.fix}`")
-            lines.append("")
 
     if show_ok:
-        ok = [f for f in report.findings if f.severity == Severity.OK]
+        ok = by_sev[Severity.OK]
         if ok:
             lines.append("## ✅ Passed checks")
             lines.append("")
@@ -149,11 +197,43 @@ def render_markdown(report: QualityReport, show_ok: bool = False) -> str:
             lines.append(f"| {dim.name} | {dim.score} | {dim.max_score} |")
         lines.append("")
 
-    if report.has_blockers:
+    if by_sev[Severity.BLOCKER]:
         lines.append("> ⛔ **UNUSABLE** — blocker issues must be resolved first.")
-    elif report.majors:
-        lines.append(f"> ⚠️ **USABLE WITH CAUTION** — {len(report.majors)} major issue(s) to fix.")
+    elif by_sev[Severity.MAJOR]:
+        lines.append(f"> ⚠️ **USABLE WITH CAUTION** — {len(by_sev[Severity.MAJOR])} major issue(s) to fix.")
     else:
         lines.append("> ✅ **GOOD** — minor or no issues detected.")
 
     return "\n".join(lines)
+
+
+def write_report_file(path: Path, data: bytes) -> None:
+    """Write a rendered report, atomically when ``path`` is (or will be) a regular file.
+
+    Symlinks, devices and pipes (``/dev/stdout``) are written through in place, as is
+    an existing file whose directory does not let us create the temp file beside it.
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        st = None
+    if st is not None and not stat.S_ISREG(st.st_mode):
+        path.write_bytes(data)
+        return
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        f = open(tmp, "wb")
+    except PermissionError:
+        if st is None:
+            raise
+        path.write_bytes(data)
+        return
+    try:
+        with f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -12,3 +12,10 @@ def fx():
     def _get(name: str) -> Path:
         return FIXTURES / name
     return _get
+
+
+@pytest.fixture(scope="module")
+def ok_codes():
+    """Finding codes for ok.csv, validated once per test module."""
+    from open_data_quality.csv_validator import CsvValidator
+    return frozenset(f.code for f in CsvValidator(FIXTURES / "ok.csv").run().findings)
@@ -2,12 +2,26 @@
 
 import json
 from pathlib import Path
+
+import pytest
 from typer.testing import CliRunner
 from open_data_quality.cli_csv import app
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
 runner = CliRunner()
 
 
+@pytest.fixture(scope="module")
+def ok_json(tmp_path_factory):
+    """JSON report for ok.csv, produced once by the CLI and shared by the tests below."""
+    out = tmp_path_factory.mktemp("json") / "report.json"
+    result = runner.invoke(app, [str(FIXTURES / "ok.csv"), "--output-json", str(out), "--no-auto-md", "--quiet"])
+    assert result.exception is None, result.output
+    assert result.exit_code == 0, result.output
+    return out
+
+
 def test_ok_exit_code_zero(fx, tmp_path):
     result = runner.invoke(app, [str(fx("ok.csv")), "--quiet"])
     assert result.exit_code == 0
@@ -23,25 +37,91 @@ def test_blocker_exit_code_two(fx, tmp_path):
     assert result.exit_code == 2
 
 
-def test_output_json(fx, tmp_path):
-    out = tmp_path / "report.json"
-    runner.invoke(app, [str(fx("ok.csv")), "--output-json", str(out), "--quiet"])
-    assert out.exists()
-    data = json.loads(out.read_text())
+def test_output_json(ok_json):
+    assert ok_json.exists()
+    data = json.loads(ok_json.read_text())
     assert "score" in data
     assert "findings" in data
 
 
-def test_output_json_has_no_blockers(fx, tmp_path):
-    out = tmp_path / "report.json"
-    runner.invoke(app, [str(fx("ok.csv")), "--output-json", str(out), "--quiet"])
-    data = json.loads(out.read_text())
+def test_output_json_has_no_blockers(ok_json):
+    data = json.loads(ok_json.read_text())
     blockers = [f for f in data["findings"] if f["severity"] == "blocker"]
     assert blockers == []
 
 
+def test_orjson_output_matches_stdlib():
+    pytest.importorskip("orjson")
+    from open_data_quality.models import QualityReport, ScoreDimension
+
+    report = QualityReport(source="qualità/dati €.csv", profile="DCAT-AP_IT")
+    report.major("phase3_content", "placeholder_values", "Valori «n.d.» nel 42.5% delle righe — ✓ 😀",
+                 detail='città("Forlì")\t1e+20', fix="usa NULL \\ vuoto")
+    report.ok("phase1_structure", "encoding", "Encoding: UTF-8 (100% confidence)")
+    report.dimensions.append(ScoreDimension("Qualità del contenuto", 25, 17, ["3.14 punti detratti", "è"]))
+    expected = json.dumps(report.to_dict(), ensure_ascii=False, indent=2)
+    assert report.to_json() == expected
+    assert report.to_json_bytes() == expected.encode("utf-8")
+
+
 def test_auto_md_written(fx, tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     runner.invoke(app, [str(fx("ok.csv")), "--quiet"])
     md_files = list((tmp_path / "open-data-quality").glob("*.md"))
     assert len(md_files) == 1
+
+
+def test_output_md_matches_auto_md(fx, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "report.md"
+    runner.invoke(app, [str(fx("ok.csv")), "--output-md", str(out), "--quiet"])
+    assert out.read_text() == (tmp_path / "open-data-quality" / "ok.md").read_text()
+
+
+def test_output_md_same_as_auto_md_path(fx, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "open-data-quality" / "ok.md"
+    result = runner.invoke(app, [str(fx("ok.csv")), "--output-md", str(out), "--quiet"])
+    assert result.exit_code == 0
+    assert out.read_text().startswith("# Open Data Quality Report")
+
+
+def test_output_md_writes_through_symlink(fx, tmp_path):
+    target = tmp_path / "target.md"
+    target.write_text("old")
+    link = tmp_path / "link.md"
+    link.symlink_to(target)
+    result = runner.invoke(app, [str(fx("ok.csv")), "--output-md", str(link), "--no-auto-md", "--quiet"])
+    assert result.exit_code == 0
+    assert link.is_symlink()
+    assert target.read_text().startswith("# Open Data Quality Report")
+
+
+def test_no_auto_md(fx, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, [str(fx("ok.csv")), "--no-auto-md", "--quiet"])
+    assert result.exit_code == 0
+    assert not (tmp_path / "open-data-quality").exists()
+
+
+def test_terminal_shows_phase_labels(fx, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, [str(fx("aggregate_rows.csv")), "--no-auto-md"])
+    assert "[phase2_columns] 1 aggregate/total row(s)" in result.output
+
+
+@pytest.mark.parametrize("content", ['{"etag": "x"}', '{"data": null}', '["data"]', '{"data": {}, "etag": 1}', "not json"])
+def test_ckan_malformed_cache_entry_is_a_miss(tmp_path, content):
+    from open_data_quality.cli_ckan import _load_cached
+
+    entry = tmp_path / "entry.json"
+    entry.write_text(content)
+    assert _load_cached(entry) is None
+
+
+def test_ckan_cache_entry_roundtrip(tmp_path):
+    from open_data_quality.cli_ckan import _load_cached
+
+    entry = tmp_path / "entry.json"
+    entry.write_text(json.dumps({"etag": '"abc"', "last_modified": None, "data": {"success": True}}))
+    assert _load_cached(entry)["data"] == {"success": True}
@@ -25,6 +25,16 @@ def _run(meta, portal_url="https://dati.gov.it/opendata"):
     return MetadataValidator(meta, portal_url=portal_url).run()
 
 
+# ── profile detection ─────────────────────────────────────────────────────────
+
+def test_every_portal_maps_to_its_profile():
+    from open_data_quality.metadata_validator import PORTAL_PROFILES, detect_profile
+
+    for pattern, profile in PORTAL_PROFILES:
+        url = "https://www." + pattern.pattern.replace("\\.", ".") + "/dataset"
+        assert detect_profile({}, url) == profile, url
+
+
 # ── issued/modified date format ───────────────────────────────────────────────
 
 def test_iso_date_accepted():
@@ -114,3 +124,82 @@ def test_uk_dcat_prefixed_dates_accepted():
     codes = {f.code for f in report.findings}
     assert "missing_issued" not in codes
     assert "missing_modified" not in codes
+
+
+# ── accessibility (HTTP probes) ───────────────────────────────────────────────
+
+def _mock_client(statuses: dict[str, int]):
+    """httpx.Client whose responses are looked up by URL; HEAD returns 405 for '/nohead'."""
+    import httpx
+
+    def handler(request):
+        url = str(request.url)
+        if request.method == "HEAD" and url.endswith("/nohead"):
+            return httpx.Response(405)
+        return httpx.Response(statuses.get(url, 404))
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_accessibility_results_in_resource_order():
+    from open_data_quality.metadata_validator import AccessibilityChecker
+    from open_data_quality.models import QualityReport
+
+    urls = [f"https://example.org/r{i}" for i in range(6)]
+    meta = {"resources": [{"id": f"res{i:05d}", "url": u} for i, u in enumerate(urls)]}
+    statuses = {u: 200 for u in urls}
+    statuses[urls[3]] = 404
+    report = QualityReport(source="test")
+    with _mock_client(statuses) as client:
+        AccessibilityChecker(meta, report, client=client, concurrency=4).run()
+    codes = [f.code for f in report.findings]
+    assert codes[:6] == [
+        "access_res00000_accessible", "access_res00001_accessible", "access_res00002_accessible",
+        "access_res00003_not_accessible", "access_res00004_accessible", "access_res00005_accessible",
+    ]
+    assert report.dimensions[-1].score == 15
+
+
+def test_accessibility_falls_back_to_get():
+    from open_data_quality.metadata_validator import AccessibilityChecker
+    from open_data_quality.models import QualityReport
+
+    url = "https://example.org/nohead"
+    report = QualityReport(source="test")
+    with _mock_client({url: 200}) as client:
+        AccessibilityChecker({"resources": [{"id": "abc", "url": url}]}, report, client=client).run()
+    assert "access_abc_accessible" in {f.code for f in report.findings}
+
+
+def test_accessibility_skip_urls_not_probed():
+    import httpx
+    from open_data_quality.metadata_validator import AccessibilityChecker
+    from open_data_quality.models import QualityReport
+
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        return httpx.Response(200)
+
+    urls = ["https://example.org/data.csv", "https://example.org/doc.pdf"]
+    meta = {"resources": [{"id": f"res{i:05d}", "url": u} for i, u in enumerate(urls)]}
+    report = QualityReport(source="test")
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        AccessibilityChecker(meta, report, client=client).run(skip_urls={urls[0]})
+    assert seen == [urls[1]]
+    assert "access_res00000_accessible" in {f.code for f in report.findings}
+
+
+def test_resource_with_null_id():
+    meta = _base_meta(resources=[{"id": None, "format": "CSV", "url": "https://example.org/a.csv"}])
+    codes = {f.code for f in _run(meta).findings}
+    assert not any(c.startswith("resource_None") for c in codes)
+
+
+def test_sniff_encoding_sees_late_non_ascii_bytes():
+    from open_data_quality.metadata_validator import _sniff_encoding
+
+    raw = b"nome,valore\n" * 1300 + "Forlì,città\n".encode("cp1252") * 20
+    assert raw.index(b"\xec") > 8192
+    assert _sniff_encoding(raw) not in ("ascii", "utf_8")
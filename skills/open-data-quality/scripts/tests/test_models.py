@@ -0,0 +1,13 @@
+"""QualityReport model tests."""
+
+from open_data_quality.models import Finding, QualityReport, Severity
+
+
+def test_has_blockers_follows_direct_findings_mutation():
+    report = QualityReport(source="test")
+    report.findings.append(Finding(Severity.BLOCKER, "phase0_blockers", "file_empty", "File is empty"))
+    assert report.has_blockers
+    assert [f.code for f in report.blockers] == ["file_empty"]
+    report.findings = []
+    assert not report.has_blockers
+    assert report.blockers == []
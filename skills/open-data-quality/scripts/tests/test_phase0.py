@@ -37,3 +37,41 @@ def test_binary_file(tmp_path):
 def test_ok_file_no_blockers(fx):
     report = CsvValidator(fx("ok.csv")).run()
     assert not report.has_blockers
+
+
+def test_from_stream_csv(fx):
+    data = fx("ok.csv").read_bytes()
+    validator = CsvValidator.from_stream(iter([data[:10], data[10:]]))
+    try:
+        assert validator.path.read_bytes() == data
+        assert validator.spooled_bytes == len(data)
+        assert not validator.run().has_blockers
+    finally:
+        validator.path.unlink()
+
+
+def test_from_stream_size_hint_truncates(fx):
+    data = fx("ok.csv").read_bytes()
+    validator = CsvValidator.from_stream(iter([data]), size_hint=len(data) + 100_000)
+    try:
+        assert validator.path.read_bytes() == data
+    finally:
+        validator.path.unlink()
+
+
+def test_from_stream_stops_on_html():
+    consumed = []
+
+    def chunks():
+        yield b"<!DOCTYPE html><html>" + b" " * 9000
+        for i in range(100):
+            consumed.append(i)
+            yield b"x" * 1024
+
+    validator = CsvValidator.from_stream(chunks())
+    try:
+        assert consumed == []
+        codes = {f.code for f in validator.run().findings}
+        assert "file_wrong_type" in codes
+    finally:
+        validator.path.unlink()
@@ -9,14 +9,19 @@ def test_bom_detected(fx):
     assert "bom_present" in codes
 
 
-def test_ok_no_bom(fx):
-    report = CsvValidator(fx("ok.csv")).run()
-    codes = {f.code for f in report.findings}
-    assert "no_bom" in codes
-    assert "bom_present" not in codes
+def test_ok_no_bom(ok_codes):
+    assert "no_bom" in ok_codes
+    assert "bom_present" not in ok_codes
+
+
+def test_ok_separator_detected(ok_codes):
+    assert "separator" in ok_codes
 
 
-def test_ok_separator_detected(fx):
-    report = CsvValidator(fx("ok.csv")).run()
+def test_path_with_quote(fx, tmp_path):
+    path = tmp_path / "l'aquila.csv"
+    path.write_bytes(fx("ok.csv").read_bytes())
+    report = CsvValidator(path).run()
     codes = {f.code for f in report.findings}
-    assert "separator" in codes
+    assert "summarize_ok" in codes
+    assert "varchar_load_failed" not in codes
@@ -21,15 +21,20 @@ def test_aggregate_rows(fx):
     assert "aggregate_rows" in codes
 
 
+def test_aggregate_keyword_needs_ascii_word_boundary(tmp_path):
+    f = tmp_path / "data.csv"
+    f.write_text("code,value\nA,1\nB,2\nTOTALEMENT,3\nèTotale,3\n")
+    agg = [x for x in CsvValidator(f).run().findings if x.code == "aggregate_rows"]
+    assert [x.message for x in agg] == ["1 aggregate/total row(s) at end of file"]
+
+
 def test_duplicate_columns(fx):
     report = CsvValidator(fx("duplicate_cols.csv")).run()
     codes = {f.code for f in report.findings}
     assert "duplicate_columns" in codes
 
 
-def test_ok_no_wide_format(fx):
-    report = CsvValidator(fx("ok.csv")).run()
-    codes = {f.code for f in report.findings}
-    assert "no_wide_format" in codes
-    assert "wide_format_years" not in codes
-    assert "wide_format_months" not in codes
+def test_ok_no_wide_format(ok_codes):
+    assert "no_wide_format" in ok_codes
+    assert "wide_format_years" not in ok_codes
+    assert "wide_format_months" not in ok_codes
@@ -21,6 +21,32 @@ def test_placeholder_values(fx):
     assert "placeholder_values" in codes
 
 
+def test_placeholder_padded_with_nbsp(tmp_path):
+    path = tmp_path / "nbsp.csv"
+    path.write_text("nome,valore\n" + "".join(f"r{i},\u00a0N/A\u00a0\n" for i in range(10)), encoding="utf-8")
+    codes = {f.code for f in CsvValidator(path).run().findings}
+    assert "placeholder_values" in codes
+
+
+def test_placeholder_with_quote(tmp_path, monkeypatch):
+    # patterns are bound as query parameters, so a quote cannot break the SQL
+    import open_data_quality.csv_validator as cv
+    monkeypatch.setattr(cv, "_PLACEHOLDER_RE", "^(n'importe)$")
+    path = tmp_path / "quote.csv"
+    path.write_text("nome,valore\n" + "".join(f"r{i},n'importe\n" for i in range(10)), encoding="utf-8")
+    finding = next(f for f in CsvValidator(path).run().findings if f.code == "placeholder_values")
+    assert "n'importe" in finding.message
+
+
+def test_failed_pattern_query_not_reported_ok(fx, monkeypatch):
+    import open_data_quality.csv_validator as cv
+    monkeypatch.setattr(cv, "_PATTERN_SQL", "SELECT * FROM __odq_missing_table")
+    codes = {f.code for f in CsvValidator(fx("ok.csv")).run().findings}
+    assert "check_failed" in codes
+    assert not codes & {"no_comma_decimal", "iso_dates", "no_units_in_cells", "no_placeholder_values"}
+    assert "no_duplicate_rows" in codes
+
+
 def test_fuzzy_duplicates(fx):
     report = CsvValidator(fx("fuzzy_duplicates.csv")).run()
     codes = {f.code for f in report.findings}
@@ -46,12 +72,10 @@ def test_outlier_values(fx):
     assert "outlier_values" in codes
 
 
-def test_ok_no_content_issues(fx):
-    report = CsvValidator(fx("ok.csv")).run()
-    codes = {f.code for f in report.findings}
-    assert "comma_decimal" not in codes
-    assert "non_iso_date" not in codes
-    assert "placeholder_values" not in codes
-    assert "fuzzy_category_values" not in codes
-    assert "duplicate_rows" not in codes
-    assert "outlier_values" not in codes
+def test_ok_no_content_issues(ok_codes):
+    assert "comma_decimal" not in ok_codes
+    assert "non_iso_date" not in ok_codes
+    assert "placeholder_values" not in ok_codes
+    assert "fuzzy_category_values" not in ok_codes
+    assert "duplicate_rows" not in ok_codes
+    assert "outlier_values" not in ok_codes
@@ -0,0 +1,18 @@
+"""Phase 4 — administrative code tests."""
+
+from open_data_quality.csv_validator import CsvValidator
+
+
+def test_invalid_reference_codes(fx):
+    report = CsvValidator(fx("reference_codes.csv")).run()
+    finding = next(f for f in report.findings if f.code == "invalid_reference_codes")
+    assert "cod_istat: 1 values look like ISTAT missing leading zeros (e.g. '1001')" in finding.detail
+    assert "nuts_code: 1 values don't match NUTS (e.g. 'IT')" in finding.detail
+    assert "country_code: 1 values not 2-letter ISO country code (e.g. 'ita')" in finding.detail
+
+
+def test_reference_codes_ok(fx):
+    report = CsvValidator(fx("reference_codes_ok.csv")).run()
+    codes = {f.code for f in report.findings}
+    assert "reference_codes_ok" in codes
+    assert "invalid_reference_codes" not in codes